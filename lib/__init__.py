@@ -15,6 +15,7 @@ from .notify import (
 )
 from .store import (
     add_event,
+    add_events,
     build_overview,
     complete_session,
     create_session,
@@ -46,6 +47,7 @@ __all__ = [
     "Session",
     "SessionStatus",
     "add_event",
+    "add_events",
     "build_overview",
     "check_and_notify",
     "complete_session",
@@ -8,7 +8,7 @@ Session export for /recall uses YAML frontmatter (schema_version: 1).
 
 from __future__ import annotations
 
-from dataclasses import asdict
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
 from .models import Session, TaskStatus
@@ -64,7 +64,7 @@ def _task_summary(tasks: list[dict]) -> dict:
 
 def export_session_json(session: Session) -> dict:
     """Export a single session as a rich JSON dict."""
-    data = asdict(session)
+    data = session.to_dict()
     data["task_summary"] = _task_summary(session.tasks)
     data["duration"] = _format_duration(session.started_at, session.ended_at)
     return data
@@ -320,21 +320,18 @@ def export_project_json(name: str, sessions: list[Session]) -> dict:
     }
 
 
-def export_project_markdown(name: str, sessions: list[Session]) -> str:
-    """Export all sessions for a project as a single Markdown document."""
-    lines: list[str] = []
-
-    lines.append(f"# Project: {name}")
-    lines.append("")
-    lines.append(f"**Sessions:** {len(sessions)}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+def iter_project_markdown(name: str, sessions: list[Session]) -> Iterator[str]:
+    """Yield the project Markdown document in chunks: a header, then one per session.
 
+    Lets callers stream a large export (web response, file) instead of holding
+    the whole document; export_project_markdown() joins the same chunks.
+    """
+    yield f"# Project: {name}\n\n**Sessions:** {len(sessions)}\n\n---\n"
     for i, session in enumerate(sessions):
-        lines.append(export_session_markdown(session, heading_level=2))
-        if i < len(sessions) - 1:
-            lines.append("---")
-            lines.append("")
+        separator = "\n" if i == 0 else "\n---\n\n"
+        yield separator + export_session_markdown(session, heading_level=2)
 
-    return "\n".join(lines)
+
+def export_project_markdown(name: str, sessions: list[Session]) -> str:
+    """Export all sessions for a project as a single Markdown document."""
+    return "".join(iter_project_markdown(name, sessions))
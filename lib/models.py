@@ -2,17 +2,37 @@
 
 from __future__ import annotations
 
+import re
 import secrets
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import MISSING, dataclass, field, fields
 from enum import StrEnum
+from typing import Any, ClassVar
 
 
+# StrEnum on purpose: members *are* str, so `status == "parked"`, dict/set lookups
+# by raw value and json.dumps all work without conversion, while callers still
+# get a closed set of names. Only construction via SessionStatus(raw) is slow
+# (EnumType.__call__) — deserialisation uses SessionStatus.from_str instead.
 class SessionStatus(StrEnum):
     ACTIVE = "active"
     COMPLETED = "completed"
     PARKED = "parked"
 
+    @classmethod
+    def from_str(cls, value: str) -> SessionStatus:
+        """SessionStatus(value) via a plain dict lookup; same ValueError on bad input."""
+        try:
+            return _STATUS_MAP[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+_STATUS_MAP: dict[str, SessionStatus] = {s._value_: s for s in SessionStatus}
+
 
 class TaskStatus(StrEnum):
     PENDING = "pending"
@@ -21,19 +41,33 @@ class TaskStatus(StrEnum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectRegistration:
     """Entry in config.json — registers a project with the dashboard."""
 
+    _FIELD_NAMES: ClassVar[tuple[str, ...]]  # set below, after class creation
+
     name: str
     path: str
     registered_at: str  # ISO 8601
 
+    def __post_init__(self) -> None:
+        self.name = sys.intern(self.name)
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "path": self.path, "registered_at": self.registered_at}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ProjectRegistration:
+        return cls(**_known_fields(cls, data))
 
-@dataclass
+
+@dataclass(slots=True)
 class Session:
     """One work session — stored as a JSON file in sessions/."""
 
+    _FIELD_NAMES: ClassVar[tuple[str, ...]]  # set below, after class creation
+
     session_id: str
     project_slug: str
     status: SessionStatus
@@ -57,20 +91,81 @@ class Session:
     next_steps: list[str] = field(default_factory=list)
     tasks: list[dict] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # Slugs, branches and roadmap refs repeat across many sessions: interning
+        # keeps one str object per distinct value and makes filter compares an
+        # identity hit.
+        self.project_slug = sys.intern(self.project_slug)
+        if self.git_branch:
+            self.git_branch = sys.intern(self.git_branch)
+        if self.roadmap_ref:
+            self.roadmap_ref = sys.intern(self.roadmap_ref)
+
+    def to_dict(self) -> dict:
+        """Plain-dict form for JSON — a flat, shallow alternative to asdict().
+
+        asdict() deep-copies every value recursively; here list fields are
+        copied one level deep, which is all JSON serialisation needs.
+        """
+        return {
+            "session_id": self.session_id,
+            "project_slug": self.project_slug,
+            "status": str(self.status),
+            "intent": self.intent,
+            "roadmap_ref": self.roadmap_ref,
+            "started_at": self.started_at,
+            "last_heartbeat": self.last_heartbeat,
+            "ended_at": self.ended_at,
+            "outcome": self.outcome,
+            "parked_reason": self.parked_reason,
+            "current_activity": self.current_activity,
+            "awaiting_action": self.awaiting_action,
+            "events": list(self.events),
+            "git_branch": self.git_branch,
+            "worktree_root": self.worktree_root,
+            "claude_session_id": self.claude_session_id,
+            "files_changed": list(self.files_changed),
+            "commits": list(self.commits),
+            "decisions": list(self.decisions),
+            "open_questions": list(self.open_questions),
+            "next_steps": list(self.next_steps),
+            "tasks": list(self.tasks),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Session:
+        """Build from a stored dict; keys that are not fields (schema_version, …) are ignored."""
+        return _load_session(data)
 
-@dataclass
+
+@dataclass(slots=True)
 class RoadmapSummary:
     """Derived roadmap status per project."""
 
+    _FIELD_NAMES: ClassVar[tuple[str, ...]]  # set below, after class creation
+
     completed: list[str] = field(default_factory=list)
     in_progress: list[str] = field(default_factory=list)
     next_up: list[str] = field(default_factory=list)  # max 3
 
+    def to_dict(self) -> dict:
+        return {
+            "completed": list(self.completed),
+            "in_progress": list(self.in_progress),
+            "next_up": list(self.next_up),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RoadmapSummary:
+        return cls(**_known_fields(cls, data))
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectState:
     """Project-level state cache — derived from sessions + roadmap."""
 
+    _FIELD_NAMES: ClassVar[tuple[str, ...]]  # set below, after class creation
+
     project_slug: str
     current_phase: str = ""
     roadmap_summary: RoadmapSummary = field(default_factory=RoadmapSummary)
@@ -82,9 +177,33 @@ class ProjectState:
     open_questions: list[str] = field(default_factory=list)
     updated_at: str = ""
 
+    def to_dict(self) -> dict:
+        return {
+            "project_slug": self.project_slug,
+            "current_phase": self.current_phase,
+            "roadmap_summary": self.roadmap_summary.to_dict(),
+            "active_sessions": self.active_sessions,
+            "parked_sessions": self.parked_sessions,
+            "total_sessions": self.total_sessions,
+            "last_activity": self.last_activity,
+            "recent_commits": list(self.recent_commits),
+            "open_questions": list(self.open_questions),
+            "updated_at": self.updated_at,
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: dict) -> ProjectState:
+        kwargs = _known_fields(cls, data)
+        kwargs["roadmap_summary"] = RoadmapSummary.from_dict(kwargs.get("roadmap_summary") or {})
+        return cls(**kwargs)
+
+
+@dataclass(frozen=True, slots=True)
 class DashboardSettings:
+    """Immutable (and hashable) — change settings via dataclasses.replace()."""
+
+    _FIELD_NAMES: ClassVar[tuple[str, ...]]  # set below, after class creation
+
     dashboard_port: int = 9000
     stale_threshold_hours: int = 24
     archive_after_days: int = 30
@@ -92,17 +211,122 @@ class DashboardSettings:
     parked_notify_hours: int = 48
     notify_cooldown_hours: int = 12
 
+    def to_dict(self) -> dict:
+        return {
+            "dashboard_port": self.dashboard_port,
+            "stale_threshold_hours": self.stale_threshold_hours,
+            "archive_after_days": self.archive_after_days,
+            "notifications_enabled": self.notifications_enabled,
+            "parked_notify_hours": self.parked_notify_hours,
+            "notify_cooldown_hours": self.notify_cooldown_hours,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> DashboardSettings:
+        return cls(**_known_fields(cls, data))
 
-@dataclass
+
+@dataclass(slots=True)
 class DashboardConfig:
+    _FIELD_NAMES: ClassVar[tuple[str, ...]]  # set below, after class creation
+
     version: int = 1
     projects: dict[str, ProjectRegistration] = field(default_factory=dict)
     settings: DashboardSettings = field(default_factory=DashboardSettings)
 
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "projects": {slug: proj.to_dict() for slug, proj in self.projects.items()},
+            "settings": self.settings.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> DashboardConfig:
+        return cls(
+            version=data.get("version", 1),
+            projects={
+                slug: ProjectRegistration.from_dict(proj)
+                for slug, proj in data.get("projects", {}).items()
+            },
+            settings=DashboardSettings.from_dict(data.get("settings", {})),
+        )
+
+
+# Field names per dataclass, computed once instead of walking fields() per call.
+for _cls in (
+    ProjectRegistration, Session, RoadmapSummary, ProjectState, DashboardSettings, DashboardConfig,
+):
+    _cls._FIELD_NAMES = tuple(f.name for f in fields(_cls))
+del _cls
+
+
+def _known_fields(cls: type, data: dict) -> dict:
+    """The subset of data that maps onto cls's fields (extra keys are dropped)."""
+    return {name: data[name] for name in cls._FIELD_NAMES if name in data}
+
+
+def _compile_loader(cls: type, **converters: Callable) -> Callable[[dict], Any]:
+    """Generate ``load(data) -> cls`` that passes every field positionally.
+
+    Same result as ``cls(**_known_fields(cls, data))`` — missing optional keys
+    take the field default, a missing required key raises KeyError — but the
+    source is generated once per class (as dataclasses does for __init__), so a
+    load is a straight run of dict lookups with no intermediate kwargs dict.
+    ``converters`` maps a field name to a callable applied to its raw value.
+    """
+    namespace: dict[str, Any] = {"cls": cls}
+    args = []
+    for f in fields(cls):
+        key = repr(f.name)
+        if f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            expr = f"data.get({key}, _default_{f.name})"
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            expr = f"(data[{key}] if {key} in data else _factory_{f.name}())"
+        else:
+            expr = f"data[{key}]"
+        if f.name in converters:
+            namespace[f"_convert_{f.name}"] = converters[f.name]
+            expr = f"_convert_{f.name}({expr})"
+        args.append(expr)
+    source = "def load(data):\n    return cls(" + ", ".join(args) + ")\n"
+    exec(source, namespace)  # source is built only from the field names above
+    return namespace["load"]
+
+
+_load_session = _compile_loader(Session, status=SessionStatus.from_str)
+
+
+# Matches generate_session_id() output only. [0-9] instead of \d keeps Unicode
+# digits out; use fullmatch so a trailing newline is rejected too.
+SESSION_ID_RE = re.compile(r"sess_[0-9]{8}T[0-9]{4}_[0-9a-f]{4}")
+
+
+def is_valid_session_id(value: str) -> bool:
+    """True if value has the exact shape of a generated session ID."""
+    return SESSION_ID_RE.fullmatch(value) is not None
+
+
+_id_lock = threading.Lock()
+_id_minute = ""
+_id_counter = 0
+
 
 def generate_session_id() -> str:
-    """Generate readable + unique session ID: sess_20260210T1430_a1b2."""
-    now = datetime.now(UTC)
-    timestamp = now.strftime("%Y%m%dT%H%M")
-    suffix = secrets.token_hex(2)
-    return f"sess_{timestamp}_{suffix}"
+    """Generate readable + unique session ID: sess_20260210T1430_a1b2.
+
+    The suffix starts at a random 16-bit value per minute and then counts up,
+    so IDs generated by one process within the same minute never collide.
+    """
+    global _id_minute, _id_counter
+    minute = time.strftime("%Y%m%dT%H%M", time.gmtime())
+    with _id_lock:
+        if minute != _id_minute:
+            _id_minute = minute
+            _id_counter = secrets.randbits(16)
+        else:
+            _id_counter = (_id_counter + 1) & 0xFFFF
+        suffix = _id_counter
+    return f"sess_{minute}_{suffix:04x}"
@@ -10,7 +10,9 @@ import json
 import logging
 import platform
 import subprocess
-from datetime import UTC, datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 
 from .store import (
     DASHBOARD_DIR,
@@ -24,6 +26,7 @@ from .store import (
 logger = logging.getLogger(__name__)
 
 NOTIFY_STATE_PATH = DASHBOARD_DIR / "notify_state.json"
+_MAX_SEND_WORKERS = 4
 
 
 # ---------------------------------------------------------------------------
@@ -31,25 +34,28 @@ NOTIFY_STATE_PATH = DASHBOARD_DIR / "notify_state.json"
 # ---------------------------------------------------------------------------
 
 
+_APPLESCRIPT_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+_OSASCRIPT_TEMPLATE = 'display notification "{message}" with title "{title}"'
+
+
 def _escape_applescript(s: str) -> str:
-    """Escape a string for use inside AppleScript double quotes."""
-    return s.replace("\\", "\\\\").replace('"', '\\"')
+    """Escape a string for use inside AppleScript double quotes (single pass)."""
+    return s.translate(_APPLESCRIPT_ESCAPE)
 
 
 def _send_notification(title: str, message: str) -> bool:
     """Send a desktop notification. Returns True if delivered."""
     if platform.system() == "Darwin":
-        escaped_title = _escape_applescript(title)
-        escaped_message = _escape_applescript(message)
-        script = (
-            f'display notification "{escaped_message}" '
-            f'with title "{escaped_title}"'
+        script = _OSASCRIPT_TEMPLATE.format(
+            message=_escape_applescript(message),
+            title=_escape_applescript(title),
         )
         try:
             subprocess.run(
                 ["osascript", "-e", script],
                 capture_output=True,
                 timeout=5,
+                check=False,
             )
             return True
         except subprocess.TimeoutExpired:
@@ -63,25 +69,57 @@ def _send_notification(title: str, message: str) -> bool:
         return False
 
 
+def _send_notifications(notifications: list[tuple[str, str]]) -> list[bool]:
+    """Send (title, message) pairs; returns per-pair delivery, in order.
+
+    Each osascript call blocks on a child process, so more than one
+    notification is dispatched from a small thread pool.
+    """
+    if len(notifications) <= 1:
+        return [_send_notification(title, message) for title, message in notifications]
+    with ThreadPoolExecutor(max_workers=min(_MAX_SEND_WORKERS, len(notifications))) as pool:
+        return list(pool.map(_send_notification, *zip(*notifications, strict=True)))
+
+
 # ---------------------------------------------------------------------------
 # Notification state — tracks what we already notified about
 # ---------------------------------------------------------------------------
 
 
-def _load_notify_state() -> dict:
-    """Load notify_state.json. Returns empty dict if missing or corrupt."""
-    if not NOTIFY_STATE_PATH.exists():
-        return {}
+def _read_notify_state() -> dict:
+    """Read notify_state.json as stored. Returns empty dict if missing or corrupt."""
     try:
         data = _safe_read_json(NOTIFY_STATE_PATH)
         if not isinstance(data, dict):
             return {}
         return data
+    except FileNotFoundError:
+        return {}
     except (json.JSONDecodeError, ValueError):
         logger.warning("Corrupt notify_state.json, starting fresh")
         return {}
 
 
+def _migrate_notify_state(state: dict) -> bool:
+    """Convert ISO-string notified_at values (older format) to epoch floats in place.
+
+    Unparseable values are dropped, which just means the next check may notify again.
+    Returns True if any entry was changed, so the caller knows to persist it.
+    """
+    changed = False
+    for entry in state.values():
+        if not isinstance(entry, dict):
+            continue
+        notified_at = entry.get("notified_at")
+        if isinstance(notified_at, str):
+            changed = True
+            try:
+                entry["notified_at"] = datetime.fromisoformat(notified_at).timestamp()
+            except ValueError:
+                del entry["notified_at"]
+    return changed
+
+
 def _save_notify_state(state: dict) -> None:
     """Atomically save notify state."""
     NOTIFY_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -108,13 +146,9 @@ def _should_notify(
     if not notified_at:
         return True
 
-    try:
-        last = datetime.fromisoformat(notified_at)
-    except ValueError:
+    if not isinstance(notified_at, (int, float)):
         return True
-
-    elapsed = (datetime.now(UTC) - last).total_seconds() / 3600
-    return elapsed >= cooldown_hours
+    return time.time() - notified_at >= cooldown_hours * 3600
 
 
 # ---------------------------------------------------------------------------
@@ -131,7 +165,7 @@ def get_long_parked_sessions(threshold_hours: int | None = None) -> list:
         config = load_config()
         threshold_hours = config.settings.parked_notify_hours
 
-    now = datetime.now(UTC)
+    cutoff = datetime.now(UTC) - timedelta(hours=threshold_hours)
     result = []
     for session in get_parked_sessions():
         if not session.ended_at:
@@ -140,8 +174,7 @@ def get_long_parked_sessions(threshold_hours: int | None = None) -> list:
             parked_at = datetime.fromisoformat(session.ended_at)
         except ValueError:
             continue
-        age_hours = (now - parked_at).total_seconds() / 3600
-        if age_hours > threshold_hours:
+        if parked_at < cutoff:
             result.append(session)
 
     return result
@@ -160,6 +193,7 @@ def check_and_notify() -> dict:
     config = load_config()
     settings = config.settings
 
+    # Fast path: only config.json is read; sessions/ is never enumerated.
     if not settings.notifications_enabled:
         return {
             "status": "disabled",
@@ -167,44 +201,55 @@ def check_and_notify() -> dict:
             "parked_notified": 0,
         }
 
-    state = _load_notify_state()
+    state = _read_notify_state()
+    migrated = _migrate_notify_state(state)
+    loaded_state = dict(state)  # entries are replaced, never mutated in place
     cooldown = settings.notify_cooldown_hours
     stale_notified = 0
     parked_notified = 0
 
+    # Collect everything due first, then send in one concurrent batch
+    pending: list[tuple[str, str, str, str]] = []  # (session_id, reason, title, message)
+
     # Check stale sessions
-    stale_sessions = get_stale_sessions()
+    # Pass thresholds from the settings loaded above, so neither helper re-reads config.json
+    stale_sessions = get_stale_sessions(settings.stale_threshold_hours)
     stale_ids = set()
     for session in stale_sessions:
         stale_ids.add(session.session_id)
         if _should_notify(session.session_id, "stale", state, cooldown):
-            sent = _send_notification(
+            pending.append((
+                session.session_id,
+                "stale",
                 "Stale sessie",
                 f"{session.project_slug}: \"{session.intent}\" — geen heartbeat",
-            )
-            if sent:
-                stale_notified += 1
-                state[session.session_id] = {
-                    "reason": "stale",
-                    "notified_at": datetime.now(UTC).isoformat(),
-                }
+            ))
 
     # Check long-parked sessions
-    parked_sessions = get_long_parked_sessions()
+    parked_sessions = get_long_parked_sessions(settings.parked_notify_hours)
     parked_ids = set()
     for session in parked_sessions:
         parked_ids.add(session.session_id)
         if _should_notify(session.session_id, "parked", state, cooldown):
-            sent = _send_notification(
+            pending.append((
+                session.session_id,
+                "parked",
                 "Geparkeerde sessie wacht",
                 f"{session.project_slug}: \"{session.intent}\"",
-            )
-            if sent:
-                parked_notified += 1
-                state[session.session_id] = {
-                    "reason": "parked",
-                    "notified_at": datetime.now(UTC).isoformat(),
-                }
+            ))
+
+    results = _send_notifications([(title, message) for _, _, title, message in pending])
+    for (session_id, reason, _, _), sent in zip(pending, results, strict=True):
+        if not sent:
+            continue
+        if reason == "stale":
+            stale_notified += 1
+        else:
+            parked_notified += 1
+        state[session_id] = {
+            "reason": reason,
+            "notified_at": time.time(),
+        }
 
     # Cleanup: remove entries for sessions no longer stale/parked
     active_ids = stale_ids | parked_ids
@@ -212,7 +257,10 @@ def check_and_notify() -> dict:
     for key in stale_keys:
         del state[key]
 
-    _save_notify_state(state)
+    # Typical tick: nothing notified, nothing resolved — skip the rewrite.
+    # A migrated legacy file is rewritten once so the conversion sticks.
+    if migrated or state != loaded_state:
+        _save_notify_state(state)
 
     return {
         "status": "checked",
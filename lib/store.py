@@ -10,18 +10,17 @@ import fcntl
 import json
 import logging
 import os
-import re
 import secrets
 import shutil
 import tempfile
+import threading
+import time
 from contextlib import contextmanager
-from dataclasses import asdict
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 from .models import (
     DashboardConfig,
-    DashboardSettings,
     ProjectRegistration,
     ProjectState,
     RoadmapSummary,
@@ -29,6 +28,7 @@ from .models import (
     SessionStatus,
     TaskStatus,
     generate_session_id,
+    is_valid_session_id,
 )
 from .validation import (
     MAX_ACTIVITY,
@@ -68,22 +68,53 @@ def _ensure_dirs() -> None:
     PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last _now_iso() call. Replaced as
+# one tuple, so concurrent threads never see a mismatched pair.
+_iso_second: tuple[int, str] = (-1, "")
+
+
 def _now_iso() -> str:
-    return datetime.now(UTC).isoformat()
+    """Current UTC time as ISO 8601 with microseconds, e.g. 2026-01-01T12:00:00.000000+00:00.
+
+    The date/time prefix is formatted once per second; within that second only
+    the microseconds change. Unlike datetime.isoformat() the fraction is always
+    present, so timestamps have a fixed width and sort correctly as strings.
+    """
+    global _iso_second
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _iso_second
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _iso_second = (seconds, prefix)
+    return f"{prefix}.{micros:06d}+00:00"
 
 
-def _atomic_write(path: Path, data: dict) -> None:
-    """Write JSON atomically via temp file + rename."""
+def _atomic_write(path: Path, data: dict, *, durable: bool = False) -> None:
+    """Write JSON atomically via temp file + rename.
+
+    Readers always see the old or the new file. With durable=True the data and
+    the rename are also fsync'ed, so they survive a power loss; that costs a
+    disk flush per write, so only rarely-written files ask for it.
+    """
     tmp_fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
-        with os.fdopen(tmp_fd, "w") as f:
+        with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
             f.write("\n")
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
         os.replace(tmp_path, path)
     except Exception:
         if os.path.exists(tmp_path):
             os.unlink(tmp_path)
         raise
+    if durable:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 
 def _safe_read_json(path: Path) -> dict:
@@ -109,8 +140,10 @@ def _safe_read_json(path: Path) -> dict:
         raise ValueError(
             f"File too large: {path.name} ({size} bytes, max {MAX_JSON_FILE_SIZE})"
         )
-    with os.fdopen(fd) as f:
-        return json.load(f)
+    # Binary read: json.loads detects UTF-8 from the bytes itself, skipping the
+    # TextIOWrapper decode layer (and its locale-dependent default encoding).
+    with os.fdopen(fd, "rb") as f:
+        return json.loads(f.read())
 
 
 def _slugify(name: str) -> str:
@@ -119,17 +152,19 @@ def _slugify(name: str) -> str:
 
 logger = logging.getLogger(__name__)
 
-_SESSION_ID_RE = re.compile(r"^sess_\d{8}T\d{4}_[0-9a-f]{4}$")
-
 MAX_JSON_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 
 
 def _validate_session_id(session_id: str) -> None:
     """Reject session IDs that could escape the sessions directory."""
-    if not _SESSION_ID_RE.match(session_id):
+    if not is_valid_session_id(session_id):
         raise ValueError(f"Invalid session ID format: {session_id}")
 
 
+# Per-thread count of held session locks; reads under a lock bypass _SESSION_CACHE.
+_lock_state = threading.local()
+
+
 @contextmanager
 def _session_lock(session_id: str):
     """Acquire an exclusive file lock for a session's read-modify-write cycle."""
@@ -139,7 +174,11 @@ def _session_lock(session_id: str):
     lock_fd = open(lock_path, "w")
     try:
         fcntl.flock(lock_fd, fcntl.LOCK_EX)
-        yield
+        _lock_state.depth = getattr(_lock_state, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            _lock_state.depth -= 1
     finally:
         fcntl.flock(lock_fd, fcntl.LOCK_UN)
         lock_fd.close()
@@ -157,30 +196,13 @@ def load_config() -> DashboardConfig:
         save_config(config)
         return config
 
-    data = _safe_read_json(CONFIG_PATH)
-
-    projects = {}
-    for slug, proj_data in data.get("projects", {}).items():
-        projects[slug] = ProjectRegistration(**proj_data)
-
-    settings_data = data.get("settings", {})
-    settings = DashboardSettings(**settings_data)
-
-    return DashboardConfig(
-        version=data.get("version", 1),
-        projects=projects,
-        settings=settings,
-    )
+    return DashboardConfig.from_dict(_safe_read_json(CONFIG_PATH))
 
 
 def save_config(config: DashboardConfig) -> None:
     _ensure_dirs()
-    data = {
-        "version": config.version,
-        "projects": {slug: asdict(proj) for slug, proj in config.projects.items()},
-        "settings": asdict(config.settings),
-    }
-    _atomic_write(CONFIG_PATH, data)
+    # The project registry is small and rarely written: worth a flush to disk.
+    _atomic_write(CONFIG_PATH, config.to_dict(), durable=True)
 
 
 # ---------------------------------------------------------------------------
@@ -230,14 +252,15 @@ def create_session(
     git_branch = validate_git_branch(git_branch)
     worktree_root = validate_optional_string(worktree_root, "worktree_root", MAX_WORKTREE_ROOT)
     claude_session_id = validate_optional_string(claude_session_id, "claude_session_id", 128)
+    now = _now_iso()
     session = Session(
         session_id=generate_session_id(),
         project_slug=project_slug,
         status=SessionStatus.ACTIVE,
         intent=intent,
         roadmap_ref=roadmap_ref,
-        started_at=_now_iso(),
-        last_heartbeat=_now_iso(),
+        started_at=now,
+        last_heartbeat=now,
         git_branch=git_branch,
         worktree_root=worktree_root,
         claude_session_id=claude_session_id,
@@ -256,37 +279,49 @@ def get_session(session_id: str) -> Session | None:
         if not path.exists():
             return None
 
-    data = _safe_read_json(path)
-
-    data = _migrate_session_data(data)
-    return _session_from_dict(data)
-
-
-def _session_from_dict(data: dict) -> Session:
-    return Session(
-        session_id=data["session_id"],
-        project_slug=data["project_slug"],
-        status=SessionStatus(data["status"]),
-        intent=data["intent"],
-        roadmap_ref=data.get("roadmap_ref"),
-        started_at=data.get("started_at", ""),
-        last_heartbeat=data.get("last_heartbeat", ""),
-        ended_at=data.get("ended_at"),
-        outcome=data.get("outcome"),
-        parked_reason=data.get("parked_reason"),
-        current_activity=data.get("current_activity"),
-        awaiting_action=data.get("awaiting_action"),
-        events=data.get("events", []),
-        git_branch=data.get("git_branch", "main"),
-        worktree_root=data.get("worktree_root"),
-        claude_session_id=data.get("claude_session_id"),
-        files_changed=data.get("files_changed", []),
-        commits=data.get("commits", []),
-        decisions=data.get("decisions", []),
-        open_questions=data.get("open_questions", []),
-        next_steps=data.get("next_steps", []),
-        tasks=data.get("tasks", []),
-    )
+    if getattr(_lock_state, "depth", 0):
+        # Read-modify-write under the session lock: always read the file itself.
+        return Session.from_dict(_migrate_session_data(_safe_read_json(path)))
+    return Session.from_dict(_read_session_cached(path))
+
+
+# Parsed + migrated session data per path, keyed on the file's stat signature.
+# Every write replaces the file (new inode, ctime, usually size), so a changed
+# file never matches its old signature. Entries are never handed out directly.
+_SESSION_CACHE: dict[Path, tuple[tuple[int, int, int, int], dict]] = {}
+_SESSION_CACHE_MAX = 1024
+# get_session() runs in web threadpool workers too; eviction and insert must not interleave.
+_SESSION_CACHE_LOCK = threading.Lock()
+
+
+def _read_session_cached(path: Path) -> dict:
+    """Session data for path, re-read only when the file's stat signature changed."""
+    st = os.stat(path, follow_symlinks=False)
+    key = (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+    cached = _SESSION_CACHE.get(path)
+    if cached is None or cached[0] != key:
+        # Signature taken before the read: if the file is replaced in between,
+        # the next lookup sees a new signature and reads again.
+        data = _migrate_session_data(_safe_read_json(path))
+        cached = (key, data)
+        with _SESSION_CACHE_LOCK:
+            if len(_SESSION_CACHE) >= _SESSION_CACHE_MAX and path not in _SESSION_CACHE:
+                del _SESSION_CACHE[next(iter(_SESSION_CACHE))]
+            _SESSION_CACHE[path] = cached
+    return _copy_session_data(cached[1])
+
+
+def _copy_session_data(data: dict) -> dict:
+    """Copy of session data deep enough that callers can mutate it freely.
+
+    List fields hold flat dicts (events, tasks, commits) or strings, so
+    copying the lists and their dict entries covers everything mutable.
+    """
+    return {
+        key: [dict(v) if isinstance(v, dict) else v for v in value]
+        if isinstance(value, list) else value
+        for key, value in data.items()
+    }
 
 
 SCHEMA_VERSION = 4
@@ -312,7 +347,7 @@ def _migrate_session_data(data: dict) -> dict:
 def _save_session(session: Session) -> None:
     _ensure_dirs()
     path = SESSIONS_DIR / f"{session.session_id}.json"
-    data = asdict(session)
+    data = session.to_dict()
     data["schema_version"] = SCHEMA_VERSION
     _atomic_write(path, data)
     _update_index(session)
@@ -405,7 +440,7 @@ def rebuild_index() -> dict[str, dict]:
             logger.warning("Skipping corrupt file during index rebuild: %s: %s", path.name, exc)
             continue
         data = _migrate_session_data(data)
-        session = _session_from_dict(data)
+        session = Session.from_dict(data)
         index[session.session_id] = _index_entry(session)
     _save_index(index)
     return index
@@ -468,31 +503,56 @@ def update_session(session_id: str, **kwargs) -> Session | None:
 
 def add_event(session_id: str, message: str) -> Session | None:
     """Append an event to the session event log (append-only)."""
-    message = validate_string_length(message, "event message", MAX_MESSAGE)
+    return add_events(session_id, [message])
+
+
+def add_events(session_id: str, messages: list[str]) -> Session | None:
+    """Batch-append events to the session event log (append-only).
+
+    All messages are validated before the lock is taken, so one invalid message
+    rejects the whole batch; the events share one timestamp and the session is
+    written once.
+    """
+    messages = [validate_string_length(m, "event message", MAX_MESSAGE) for m in messages]
     with _session_lock(session_id):
         session = get_session(session_id)
         if not session:
             return None
 
-        session.events.append({"timestamp": _now_iso(), "message": message})
-        session.last_heartbeat = _now_iso()
+        now = _now_iso()
+        session.events.extend({"timestamp": now, "message": message} for message in messages)
+        session.last_heartbeat = now
         _save_session(session)
         return session
 
 
 def add_commit(session_id: str, sha: str, message: str) -> Session | None:
     """Append a commit to the session. Deduplicates on SHA[:7]."""
-    validate_sha(sha)
-    message = validate_string_length(message, "commit message", MAX_MESSAGE)
+    return add_commits(session_id, [(sha, message)])
+
+
+def add_commits(session_id: str, commits: list[tuple[str, str]]) -> Session | None:
+    """Batch-append (sha, message) commits to the session. Deduplicates on SHA[:7].
+
+    All entries are validated before the lock is taken, so one bad entry
+    rejects the whole batch; the session file is written once.
+    """
+    validated = []
+    for sha, message in commits:
+        validate_sha(sha)
+        validated.append((sha, validate_string_length(message, "commit message", MAX_MESSAGE)))
     with _session_lock(session_id):
         session = get_session(session_id)
         if not session:
             return None
 
-        short_sha = sha[:7]
         existing = {(c.get("sha", "")[:7]) for c in session.commits}
-        if short_sha not in existing:
+        for sha, message in validated:
+            short_sha = sha[:7]
+            if short_sha in existing:
+                continue
             session.commits.append({"sha": sha, "message": message})
+            existing.add(short_sha)
         session.last_heartbeat = _now_iso()
         _save_session(session)
         return session
@@ -540,7 +600,8 @@ def clear_action(session_id: str) -> Session | None:
         return session
 
 
-VALID_TASK_STATUSES = set(TaskStatus)
+VALID_TASK_STATUSES = frozenset(TaskStatus)
+_TASK_STATUS_CHOICES = ", ".join(sorted(VALID_TASK_STATUSES))
 
 
 def _generate_task_id() -> str:
@@ -554,7 +615,11 @@ def add_task(session_id: str, subject: str) -> Session | None:
 
 
 def add_tasks(session_id: str, subjects: list[str]) -> Session | None:
-    """Batch-append tasks to the session. Deduplicates on subject."""
+    """Batch-append tasks to the session. Deduplicates on subject.
+
+    All subjects are validated before the lock is taken, so one invalid subject
+    rejects the whole batch; the session is then written once for the batch.
+    """
     subjects = [validate_string_length(s, "task subject", MAX_TASK_SUBJECT) for s in subjects]
     with _session_lock(session_id):
         session = get_session(session_id)
@@ -590,9 +655,7 @@ def update_task(
     """Update a task's status (and optionally subject). Raises ValueError if task_id not found."""
     subject = validate_optional_string(subject, "task subject", MAX_TASK_SUBJECT)
     if status not in VALID_TASK_STATUSES:
-        raise ValueError(
-            f"Invalid status '{status}'. Must be one of: {sorted(VALID_TASK_STATUSES)}"
-        )
+        raise ValueError(f"Invalid status '{status}'. Must be one of: {_TASK_STATUS_CHOICES}")
 
     with _session_lock(session_id):
         session = get_session(session_id)
@@ -609,11 +672,12 @@ def update_task(
                     if subject in existing:
                         msg = f"Task subject '{subject}' already exists in session {session_id}"
                         raise ValueError(msg)
+                now = _now_iso()
                 task["status"] = status
-                task["updated_at"] = _now_iso()
+                task["updated_at"] = now
                 if subject is not None:
                     task["subject"] = subject
-                session.last_heartbeat = _now_iso()
+                session.last_heartbeat = now
                 _save_session(session)
                 return session
 
@@ -703,14 +767,15 @@ def resume_session(session_id: str, new_intent: str | None = None) -> Session:
         _save_session(old)
 
     # Create new session with pre-generated ID (outside lock to avoid nesting)
+    now = _now_iso()
     new_session = Session(
         session_id=new_session_id,
         project_slug=project_slug,
         status=SessionStatus.ACTIVE,
         intent=intent,
         roadmap_ref=roadmap_ref,
-        started_at=_now_iso(),
-        last_heartbeat=_now_iso(),
+        started_at=now,
+        last_heartbeat=now,
         git_branch=git_branch,
         worktree_root=worktree_root,
         open_questions=open_questions,
@@ -744,6 +809,7 @@ def list_sessions(
     status: SessionStatus | None = None,
     include_archived: bool = False,
     full_load: bool = True,
+    limit: int | None = None,
 ) -> list[Session]:
     """List sessions, optionally filtered by project and/or status.
 
@@ -753,6 +819,9 @@ def list_sessions(
     index without reading individual session files (fast path).
     Archived sessions are excluded by default. Pass include_archived=True
     to include them.
+    With limit, only the newest `limit` sessions are returned; index entries
+    are ordered by started_at and archive files by name first, so only those
+    session files are read.
     """
     _ensure_dirs()
 
@@ -765,15 +834,23 @@ def list_sessions(
     else:
         index = _load_index()
         # If file exists but returned empty, it might be corrupt — check file
-        if not index and idx_path.stat().st_size > 2:
+        # (a valid empty index is saved as "{}\n", 3 bytes)
+        if not index and idx_path.stat().st_size > 3:
             index = rebuild_index()
 
+    matches = [
+        (sid, entry)
+        for sid, entry in index.items()
+        if (not project_slug or entry.get("project_slug") == project_slug)
+        and (not status or entry.get("status") == status)
+    ]
+    if limit is not None:
+        matches.sort(key=lambda item: item[1].get("started_at") or "", reverse=True)
+
     sessions = []
-    for sid, entry in index.items():
-        if project_slug and entry.get("project_slug") != project_slug:
-            continue
-        if status and entry.get("status") != status:
-            continue
+    for sid, entry in matches:
+        if limit is not None and len(sessions) >= limit:
+            break
         if full_load:
             session = get_session(sid)
             if session:
@@ -783,14 +860,23 @@ def list_sessions(
 
     # Include archived sessions by scanning archive dir (not indexed)
     if include_archived:
-        for path in ARCHIVE_DIR.glob("sess_*.json"):
+        paths = ARCHIVE_DIR.glob("sess_*.json")
+        cutoff, archived = None, 0
+        if limit is not None:
+            # File names start with the creation minute (sess_YYYYMMDDTHHMM_xxxx),
+            # so newest-first by name lets the scan stop after `limit` matches.
+            paths = sorted(paths, key=lambda p: p.name, reverse=True)
+        for path in paths:
+            minute = path.stem.rsplit("_", 1)[0]
+            if cutoff is not None and minute < cutoff:
+                break  # same-minute files are still read: their suffixes are not ordered
             try:
                 data = _safe_read_json(path)
             except (json.JSONDecodeError, ValueError) as exc:
                 logger.warning("Skipping corrupt/invalid file %s: %s", path.name, exc)
                 continue
             data = _migrate_session_data(data)
-            session = _session_from_dict(data)
+            session = Session.from_dict(data)
 
             if project_slug and session.project_slug != project_slug:
                 continue
@@ -798,9 +884,13 @@ def list_sessions(
                 continue
 
             sessions.append(session)
+            if limit is not None:
+                archived += 1
+                if archived == limit:
+                    cutoff = minute
 
     sessions.sort(key=lambda s: s.started_at, reverse=True)
-    return sessions
+    return sessions if limit is None else sessions[:limit]
 
 
 def get_active_sessions(project_slug: str | None = None) -> list[Session]:
@@ -812,19 +902,29 @@ def get_parked_sessions(project_slug: str | None = None) -> list[Session]:
 
 
 def get_stale_sessions(threshold_hours: int | None = None) -> list[Session]:
-    """Find active sessions whose heartbeat is older than the threshold."""
+    """Find active sessions whose heartbeat is older than the threshold.
+
+    The heartbeat in the session index pre-filters, so only candidates are read
+    from disk; the file's own heartbeat then decides. The index is written after
+    the session file, so it can lag behind (a false candidate, dropped here) but
+    never run ahead of it.
+    """
     if threshold_hours is None:
         config = load_config()
         threshold_hours = config.settings.stale_threshold_hours
 
-    now = datetime.now(UTC)
+    cutoff = datetime.now(UTC) - timedelta(hours=threshold_hours)
+
+    def is_stale(s: Session) -> bool:
+        return bool(s.last_heartbeat) and datetime.fromisoformat(s.last_heartbeat) < cutoff
+
     stale = []
-    for session in get_active_sessions():
-        if session.last_heartbeat:
-            hb = datetime.fromisoformat(session.last_heartbeat)
-            age_hours = (now - hb).total_seconds() / 3600
-            if age_hours > threshold_hours:
-                stale.append(session)
+    for candidate in list_sessions(status=SessionStatus.ACTIVE, full_load=False):
+        if not is_stale(candidate):
+            continue
+        session = get_session(candidate.session_id)
+        if session and session.status == SessionStatus.ACTIVE and is_stale(session):
+            stale.append(session)
 
     return stale
 
@@ -958,15 +1058,27 @@ def cleanup_stale_sessions(threshold_hours: int | None = None) -> list[Session]:
 def cleanup_orphaned_locks() -> list[str]:
     """Remove .lock files that have no matching session JSON file."""
     _ensure_dirs()
+    # One directory pass collects both sides; no per-lock exists() stat.
+    json_stems: set[str] = set()
+    lock_stems: set[str] = set()
+    with os.scandir(SESSIONS_DIR) as entries:
+        for entry in entries:
+            stem, dot, suffix = entry.name.rpartition(".")
+            if not dot:
+                continue
+            if suffix == "json":
+                json_stems.add(stem)
+            elif suffix == "lock":
+                lock_stems.add(stem)
+
     removed: list[str] = []
-    for lock_file in SESSIONS_DIR.glob("*.lock"):
-        session_file = lock_file.with_suffix(".json")
-        if not session_file.exists():
-            try:
-                lock_file.unlink()
-                removed.append(lock_file.name)
-            except OSError as exc:
-                logger.warning("Failed to remove orphaned lock %s: %s", lock_file, exc)
+    for stem in sorted(lock_stems - json_stems):
+        lock_file = SESSIONS_DIR / f"{stem}.lock"
+        try:
+            lock_file.unlink()
+            removed.append(lock_file.name)
+        except OSError as exc:
+            logger.warning("Failed to remove orphaned lock %s: %s", lock_file, exc)
     return removed
 
 
@@ -1084,7 +1196,7 @@ def get_archived_session(session_id: str) -> Session | None:
     data = _safe_read_json(path)
 
     data = _migrate_session_data(data)
-    return _session_from_dict(data)
+    return Session.from_dict(data)
 
 
 # ---------------------------------------------------------------------------
@@ -1098,27 +1210,7 @@ def get_project_state(project_slug: str) -> ProjectState | None:
     if not path.exists():
         return None
 
-    data = _safe_read_json(path)
-
-    roadmap_data = data.get("roadmap_summary", {})
-    roadmap = RoadmapSummary(
-        completed=roadmap_data.get("completed", []),
-        in_progress=roadmap_data.get("in_progress", []),
-        next_up=roadmap_data.get("next_up", []),
-    )
-
-    return ProjectState(
-        project_slug=data["project_slug"],
-        current_phase=data.get("current_phase", ""),
-        roadmap_summary=roadmap,
-        active_sessions=data.get("active_sessions", 0),
-        parked_sessions=data.get("parked_sessions", 0),
-        total_sessions=data.get("total_sessions", 0),
-        last_activity=data.get("last_activity", ""),
-        recent_commits=data.get("recent_commits", []),
-        open_questions=data.get("open_questions", []),
-        updated_at=data.get("updated_at", ""),
-    )
+    return ProjectState.from_dict(_safe_read_json(path))
 
 
 def update_project_state(
@@ -1208,7 +1300,7 @@ def _refresh_project_state(project_slug: str) -> ProjectState:
 def _save_project_state(state: ProjectState) -> None:
     _ensure_dirs()
     path = PROJECTS_DIR / f"{state.project_slug}.json"
-    _atomic_write(path, asdict(state))
+    _atomic_write(path, state.to_dict())
 
 
 def get_all_project_states() -> list[ProjectState]:
@@ -1268,7 +1360,7 @@ def build_overview() -> dict:
         state = get_project_state(slug)
         active = get_active_sessions(slug)
         parked = get_parked_sessions(slug)
-        completed = list_sessions(project_slug=slug, status=SessionStatus.COMPLETED)[:5]
+        completed = list_sessions(project_slug=slug, status=SessionStatus.COMPLETED, limit=5)
 
         projects.append(
             {
@@ -1323,5 +1415,5 @@ def build_overview() -> dict:
     return {
         "timestamp": _now_iso(),
         "projects": projects,
-        "settings": asdict(config.settings),
+        "settings": config.settings.to_dict(),
     }
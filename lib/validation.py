@@ -6,6 +6,8 @@ share the same constraints.
 
 from __future__ import annotations
 
+import functools
+import json
 import re
 
 # ---------------------------------------------------------------------------
@@ -28,9 +30,24 @@ MAX_WORKTREE_ROOT = 4096
 # Regex patterns
 # ---------------------------------------------------------------------------
 
-_PROJECT_SLUG_RE = re.compile(r"^[a-z0-9][a-z0-9\-]*$")
-_SHA_RE = re.compile(r"^[0-9a-fA-F]{4,40}$")
-_GIT_BRANCH_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._/\-]*$")
+# Patterns are anchored via fullmatch() and encode the length constraint for SHAs
+# themselves. Slug and branch validators first reject empty values (and None)
+# with their own message, then do a single fullmatch() walk.
+_PROJECT_SLUG_RE = re.compile(r"[a-z0-9][a-z0-9\-]*")
+_SHA_RE = re.compile(r"[0-9a-fA-F]{4,40}")
+_GIT_BRANCH_RE = re.compile(r"[a-zA-Z0-9][a-zA-Z0-9._/\-]*")
+
+
+# SHAs and branch names recur across commits/sessions in one process; cache the
+# boolean match only so the raising wrappers still build fresh error messages.
+@functools.lru_cache(maxsize=4096)
+def _sha_valid(sha: str) -> bool:
+    return _SHA_RE.fullmatch(sha) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def _git_branch_valid(branch: str) -> bool:
+    return _GIT_BRANCH_RE.fullmatch(branch) is not None
 
 
 # ---------------------------------------------------------------------------
@@ -59,17 +76,17 @@ def validate_project_slug(slug: str) -> str:
     """Validate project slug format (lowercase alphanumeric + hyphens)."""
     if not slug:
         raise ValueError("Project slug cannot be empty")
-    if not _PROJECT_SLUG_RE.match(slug):
-        raise ValueError(
-            f"Invalid project slug: '{slug}'. "
-            "Must be lowercase alphanumeric with hyphens, starting with alphanumeric."
-        )
-    return slug
+    if _PROJECT_SLUG_RE.fullmatch(slug):
+        return slug
+    raise ValueError(
+        f"Invalid project slug: '{slug}'. "
+        "Must be lowercase alphanumeric with hyphens, starting with alphanumeric."
+    )
 
 
 def validate_sha(sha: str) -> str:
     """Validate git commit SHA (4-40 hex characters)."""
-    if not _SHA_RE.match(sha):
+    if not _sha_valid(sha):
         raise ValueError(f"Invalid commit SHA: '{sha}'. Must be 4-40 hex characters.")
     return sha
 
@@ -78,12 +95,12 @@ def validate_git_branch(branch: str) -> str:
     """Validate git branch name."""
     if not branch:
         raise ValueError("Git branch cannot be empty")
-    if not _GIT_BRANCH_RE.match(branch):
-        raise ValueError(
-            f"Invalid git branch name: '{branch}'. "
-            "Must start with alphanumeric, contain only [a-zA-Z0-9._/-]."
-        )
-    return branch
+    if _git_branch_valid(branch):
+        return branch
+    raise ValueError(
+        f"Invalid git branch name: '{branch}'. "
+        "Must start with alphanumeric, contain only [a-zA-Z0-9._/-]."
+    )
 
 
 def validate_positive_int(value: int, field: str, max_val: int | None = None) -> int:
@@ -105,6 +122,14 @@ def validate_port(port: int) -> int:
 MAX_COMMITS = 500
 
 
+def _validate_commit_entry(i: int, entry: object) -> None:
+    if not isinstance(entry, dict):
+        raise ValueError(f"Commit entry {i} must be an object")
+    if "sha" not in entry or "message" not in entry:
+        raise ValueError(f"Commit entry {i} must have 'sha' and 'message' fields")
+    validate_sha(str(entry["sha"]))
+
+
 def validate_commits_json(commits: list) -> list[dict]:
     """Validate that commits is a list of {sha, message} dicts."""
     if not isinstance(commits, list):
@@ -112,9 +137,45 @@ def validate_commits_json(commits: list) -> list[dict]:
     if len(commits) > MAX_COMMITS:
         raise ValueError(f"Too many commits ({len(commits)}, max {MAX_COMMITS})")
     for i, entry in enumerate(commits):
-        if not isinstance(entry, dict):
-            raise ValueError(f"Commit entry {i} must be an object")
-        if "sha" not in entry or "message" not in entry:
-            raise ValueError(f"Commit entry {i} must have 'sha' and 'message' fields")
-        validate_sha(str(entry["sha"]))
+        _validate_commit_entry(i, entry)
+    return commits
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WS_RE = re.compile(r"[ \t\n\r]*")
+
+
+def parse_commits_json(raw: str) -> list[dict]:
+    """Parse and validate a JSON array of commits one entry at a time.
+
+    Rejects at the first invalid entry or as soon as MAX_COMMITS is exceeded,
+    without decoding the rest of the input. Malformed JSON raises
+    json.JSONDecodeError, validation failures raise ValueError.
+    """
+    pos = _JSON_WS_RE.match(raw).end()
+    if not raw.startswith("[", pos):
+        raise ValueError("Commits must be a JSON array")
+    pos = _JSON_WS_RE.match(raw, pos + 1).end()
+
+    commits: list[dict] = []
+    if raw.startswith("]", pos):
+        pos += 1
+    else:
+        while True:
+            if len(commits) == MAX_COMMITS:
+                raise ValueError(f"Too many commits (max {MAX_COMMITS})")
+            entry, pos = _JSON_DECODER.raw_decode(raw, pos)
+            _validate_commit_entry(len(commits), entry)
+            commits.append(entry)
+            pos = _JSON_WS_RE.match(raw, pos).end()
+            if raw.startswith(",", pos):
+                pos = _JSON_WS_RE.match(raw, pos + 1).end()
+            elif raw.startswith("]", pos):
+                pos += 1
+                break
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", raw, pos)
+
+    if _JSON_WS_RE.match(raw, pos).end() != len(raw):
+        raise json.JSONDecodeError("Extra data", raw, pos)
     return commits
@@ -14,7 +14,8 @@ import json
 import shutil
 import subprocess
 import sys
-from dataclasses import asdict
+import tempfile
+import threading
 from pathlib import Path
 
 # Add parent dir to path so `from lib import ...` works
@@ -22,6 +23,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from lib import export, store
 from lib.models import SessionStatus
+from lib.validation import parse_commits_json
+
+_GIT_TIMEOUT = 10  # seconds for the whole `git log` in capture-commits
 
 
 def main() -> None:
@@ -254,7 +258,9 @@ def main() -> None:
 
 
 def _dispatch(args: argparse.Namespace) -> dict | list:
-    cmd = args.command
+    # argparse hands back a fresh str; interning makes the literal compares below
+    # identity hits instead of char-by-char compares.
+    cmd = sys.intern(args.command)
 
     if cmd == "register-project":
         slug = store.register_project(args.name, args.path)
@@ -262,7 +268,7 @@ def _dispatch(args: argparse.Namespace) -> dict | list:
 
     if cmd == "list-projects":
         projects = store.get_registered_projects()
-        return {slug: asdict(p) for slug, p in projects.items()}
+        return {slug: p.to_dict() for slug, p in projects.items()}
 
     if cmd == "create-session":
         session = store.create_session(
@@ -272,7 +278,7 @@ def _dispatch(args: argparse.Namespace) -> dict | list:
             git_branch=args.git_branch,
             worktree_root=args.worktree_root,
         )
-        return asdict(session)
+        return session.to_dict()
 
     if cmd == "register-launch":
         session = store.register_launch(
@@ -288,7 +294,7 @@ def _dispatch(args: argparse.Namespace) -> dict | list:
             session = store.get_session(args.session_id)
         except ValueError:
             return {"error": "Invalid session ID format"}
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "update-session":
         kwargs = {}
@@ -299,45 +305,45 @@ def _dispatch(args: argparse.Namespace) -> dict | list:
         if args.roadmap_ref is not None:
             kwargs["roadmap_ref"] = args.roadmap_ref
         session = store.update_session(args.session_id, **kwargs)
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "add-event":
         session = store.add_event(args.session_id, args.message)
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "add-commit":
         session = store.add_commit(args.session_id, args.sha, args.message)
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "add-decision":
         session = store.add_decision(args.session_id, args.decision)
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "capture-commits":
         return _capture_commits(args.session_id, args.repo_path)
 
     if cmd == "request-action":
         session = store.request_action(args.session_id, args.reason)
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "clear-action":
         session = store.clear_action(args.session_id)
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "add-task":
         session = store.add_task(args.session_id, args.subject)
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "add-tasks":
         session = store.add_tasks(args.session_id, args.subjects)
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "update-task":
         try:
             session = store.update_task(
                 args.session_id, args.task_id, args.status, args.subject
             )
-            return asdict(session) if session else {"error": "Session not found"}
+            return session.to_dict() if session else {"error": "Session not found"}
         except ValueError as e:
             return {"error": str(e)}
 
@@ -346,7 +352,7 @@ def _dispatch(args: argparse.Namespace) -> dict | list:
 
     if cmd == "heartbeat":
         session = store.heartbeat(args.session_id)
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "heartbeat-project":
         sessions = store.heartbeat_project(args.project_slug)
@@ -354,7 +360,7 @@ def _dispatch(args: argparse.Namespace) -> dict | list:
 
     if cmd == "complete-session":
         try:
-            commits = json.loads(args.commits) if args.commits else None
+            commits = parse_commits_json(args.commits) if args.commits else None
         except json.JSONDecodeError as e:
             return {"error": f"Invalid commits JSON: {e}"}
         session = store.complete_session(
@@ -364,7 +370,7 @@ def _dispatch(args: argparse.Namespace) -> dict | list:
             commits=commits,
             files_changed=args.files_changed or None,
         )
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "park-session":
         session = store.park_session(
@@ -372,26 +378,26 @@ def _dispatch(args: argparse.Namespace) -> dict | list:
             reason=args.reason,
             next_steps=args.next_steps or None,
         )
-        return asdict(session) if session else {"error": "Session not found"}
+        return session.to_dict() if session else {"error": "Session not found"}
 
     if cmd == "resume-session":
         session = store.resume_session(
             session_id=args.session_id,
             new_intent=args.intent,
         )
-        return asdict(session)
+        return session.to_dict()
 
     if cmd == "active-sessions":
         sessions = store.get_active_sessions(project_slug=args.project)
-        return [asdict(s) for s in sessions]
+        return [s.to_dict() for s in sessions]
 
     if cmd == "parked-sessions":
         sessions = store.get_parked_sessions(project_slug=args.project)
-        return [asdict(s) for s in sessions]
+        return [s.to_dict() for s in sessions]
 
     if cmd == "stale-sessions":
         sessions = store.get_stale_sessions()
-        return [asdict(s) for s in sessions]
+        return [s.to_dict() for s in sessions]
 
     if cmd == "launch-plan":
         occupied = store.get_fresh_sessions_for_worktree(args.path)
@@ -429,7 +435,7 @@ def _dispatch(args: argparse.Namespace) -> dict | list:
         return {"archived": len(archived), "session_ids": archived}
 
     if cmd == "list-sessions":
-        status = SessionStatus(args.status) if args.status else None
+        status = SessionStatus.from_str(args.status) if args.status else None
         sessions = store.list_sessions(
             project_slug=args.project,
             status=status,
@@ -440,11 +446,11 @@ def _dispatch(args: argparse.Namespace) -> dict | list:
                 s for s in sessions
                 if s.started_at and str(s.started_at)[:10] >= args.since
             ]
-        return [asdict(s) for s in sessions[: args.limit]]
+        return [s.to_dict() for s in sessions[: args.limit]]
 
     if cmd == "project-state":
         state = store.get_project_state(args.project_slug)
-        return asdict(state) if state else {"error": "Project state not found"}
+        return state.to_dict() if state else {"error": "Project state not found"}
 
     if cmd == "update-project-state":
         state = store.update_project_state(
@@ -454,7 +460,7 @@ def _dispatch(args: argparse.Namespace) -> dict | list:
             roadmap_in_progress=args.in_progress,
             roadmap_next_up=args.next_up,
         )
-        return asdict(state)
+        return state.to_dict()
 
     if cmd == "export":
         return _handle_export(args)
@@ -787,35 +793,61 @@ def _capture_commits(session_id: str, repo_path: str) -> dict:
     if not session:
         return {"error": "Session not found"}
 
+    # Stream git's stdout line by line instead of buffering the whole log,
+    # then hand the collected commits to the store in a single write.
+    # The timer enforces the deadline while reading (a hung git never reaches EOF);
+    # stderr goes to a temp file so a chatty git cannot block on a full pipe.
+    commits: list[tuple[str, str]] = []
+    timed_out = threading.Event()
     try:
-        result = subprocess.run(
-            [
-                "git", "log",
-                f"--since={session.started_at}",
-                "--format=%H|%s",
-            ],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        with (
+            tempfile.TemporaryFile(mode="w+") as stderr_file,
+            subprocess.Popen(
+                [
+                    "git", "log",
+                    f"--since={session.started_at}",
+                    "--format=%H|%s",
+                ],
+                cwd=repo_path,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                bufsize=1,
+            ) as proc,
+        ):
+            def kill() -> None:
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(_GIT_TIMEOUT, kill)
+            timer.start()
+            try:
+                for line in proc.stdout:
+                    if "|" not in line:
+                        continue
+                    sha, message = line.split("|", 1)
+                    commits.append((sha.strip(), message.strip()))
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+    except FileNotFoundError as e:
         return {"error": f"Git command failed: {e}"}
 
-    if result.returncode != 0:
-        return {"error": f"git log failed: {result.stderr.strip()}"}
+    if timed_out.is_set():
+        error = subprocess.TimeoutExpired(proc.args, _GIT_TIMEOUT)
+        return {"error": f"Git command failed: {error}"}
 
-    added = 0
-    for line in result.stdout.strip().splitlines():
-        if "|" not in line:
-            continue
-        sha, message = line.split("|", 1)
-        before = len(session.commits)
-        session = store.add_commit(session_id, sha.strip(), message.strip())
-        if session and len(session.commits) > before:
-            added += 1
+    if returncode != 0:
+        return {"error": f"git log failed: {stderr.strip()}"}
+
+    before = len(session.commits)
+    if commits:
+        session = store.add_commits(session_id, commits)
+    total = len(session.commits) if session else 0
 
-    return {"captured": added, "total_commits": len(session.commits) if session else 0}
+    return {"captured": max(total - before, 0), "total_commits": total}
 
 
 def _setup_project(project_path: str, project_name: str | None) -> dict:
@@ -853,16 +885,13 @@ def _serve(host: str, port: int) -> None:
     """Start the web dashboard via uvicorn."""
     import uvicorn
 
-    web_dir = Path(__file__).parent / "web"
-    sys.path.insert(0, str(web_dir))
-
     print(f"Dashboard: http://{host}:{port}")
     uvicorn.run(
-        "app:app",
+        "web.app:app",
         host=host,
         port=port,
         log_level="warning",
-        app_dir=str(web_dir),
+        app_dir=str(Path(__file__).parent),
     )
 
 
@@ -2,8 +2,122 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import sys
+import tempfile
+from collections.abc import Callable
 from pathlib import Path
 
+import pytest
+
 # Ensure the project root is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lib import store
+
+_SHM = Path("/dev/shm")
+
+
+_shm_basetemp_key = pytest.StashKey[Path]()
+
+
+def pytest_configure(config):
+    """Put pytest's temp dirs on tmpfs when available (Linux CI).
+
+    Every store mutation is a write + rename; on tmpfs those never hit a disk.
+    Only pytest's basetemp moves: TMPDIR stays as it is for the code under test
+    and the subprocesses it spawns. An explicit --basetemp or TMPDIR always wins;
+    xdist workers inherit the controller's basetemp that way.
+    """
+    if config.option.basetemp or "TMPDIR" in os.environ:
+        return
+    if _SHM.is_dir() and os.access(_SHM, os.W_OK):
+        basetemp = Path(tempfile.mkdtemp(prefix="pytest-", dir=_SHM))
+        config.option.basetemp = str(basetemp)
+        config.stash[_shm_basetemp_key] = basetemp
+
+
+def pytest_unconfigure(config):
+    """Remove the tmpfs basetemp again: it lives in RAM and pytest does not rotate it."""
+    basetemp = config.stash.get(_shm_basetemp_key, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def _store_root(tmp_path_factory):
+    """Point all store paths at one temp directory for the whole test run."""
+    root = tmp_path_factory.mktemp("dashboard")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(store, "DASHBOARD_DIR", root)
+        mp.setattr(store, "SESSIONS_DIR", root / "sessions")
+        mp.setattr(store, "ARCHIVE_DIR", root / "sessions" / "archive")
+        mp.setattr(store, "PROJECTS_DIR", root / "projects")
+        mp.setattr(store, "CONFIG_PATH", root / "config.json")
+        yield root
+
+
+@pytest.fixture
+def store_root(_store_root: Path) -> Path:
+    """Empty the shared store directory for one test.
+
+    Subdirectories are not recreated: store functions create them on first
+    write. Tests that put files into them directly use ``store_dirs``.
+    """
+    for entry in _store_root.iterdir():
+        if entry.is_dir() and not entry.is_symlink():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
+    store._SESSION_CACHE.clear()
+    return _store_root
+
+
+@pytest.fixture
+def store_dirs(store_root: Path) -> Path:
+    """Empty store with the sessions/archive/projects layout already created."""
+    store._ensure_dirs()
+    return store_root
+
+
+def _snapshot(root: Path) -> dict[Path, bytes]:
+    """Raw bytes of every file under root, keyed by relative path."""
+    return {p.relative_to(root): p.read_bytes() for p in root.rglob("*") if p.is_file()}
+
+
+def _restore(root: Path, files: dict[Path, bytes]) -> None:
+    """Write a _snapshot() back into an empty root."""
+    for rel, data in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
+@pytest.fixture(scope="module")
+def seed_session() -> Callable[[], str]:
+    """How ``session_id`` creates its session; override per module for another seed."""
+    return lambda: store.create_session(
+        project_slug="test-project", intent="Test session",
+    ).session_id
+
+
+@pytest.fixture(scope="module")
+def _seeded_store(_store_root: Path, seed_session) -> tuple[str, dict[Path, bytes]]:
+    """Run seed_session once per module and snapshot the raw store files.
+
+    Each test restores the bytes (session file, index, project state) instead
+    of going through register + create again.
+    """
+    shutil.rmtree(_store_root)
+    _store_root.mkdir()
+    sid = seed_session()
+    return sid, _snapshot(_store_root)
+
+
+@pytest.fixture
+def session_id(_seeded_store, store_root: Path) -> str:
+    """The module's seeded session in the (otherwise empty) store; returns its ID."""
+    sid, files = _seeded_store
+    _restore(store_root, files)
+    return sid
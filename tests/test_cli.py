@@ -7,18 +7,29 @@ subprocess overhead while still testing the full command → store → JSON pipe
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 from lib import store
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib parses the same documents
+    from json import loads as _json_loads
+
 # Import _dispatch from manage.py
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from manage import _dispatch
+from manage import _dispatch, main
+
+_MANAGE_PY = str(Path(__file__).resolve().parent.parent / "manage.py")
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -26,19 +37,32 @@ from manage import _dispatch
 
 
 @pytest.fixture(autouse=True)
-def _isolate_store(tmp_path, monkeypatch):
-    """Redirect all store paths to a temp directory."""
-    monkeypatch.setattr(store, "DASHBOARD_DIR", tmp_path)
-    monkeypatch.setattr(store, "SESSIONS_DIR", tmp_path / "sessions")
-    monkeypatch.setattr(store, "ARCHIVE_DIR", tmp_path / "sessions" / "archive")
-    monkeypatch.setattr(store, "PROJECTS_DIR", tmp_path / "projects")
-    monkeypatch.setattr(store, "CONFIG_PATH", tmp_path / "config.json")
-    store._ensure_dirs()
-
-
-def ns(**kwargs) -> argparse.Namespace:
-    """Shorthand for creating argparse Namespace objects."""
-    return argparse.Namespace(**kwargs)
+def _isolate_store(store_root):
+    """Start every test on an empty store (shared temp dir, see conftest)."""
+    return store_root
+
+
+def ns(proto: argparse.Namespace | None = None, /, **kwargs) -> argparse.Namespace:
+    """Shorthand for creating argparse Namespace objects, optionally from a prototype."""
+    if proto is None:
+        return argparse.Namespace(**kwargs)
+    return argparse.Namespace(**{**vars(proto), **kwargs})
+
+
+# Prototypes with the argparse defaults of commands used by several tests, so a
+# new CLI option only needs to be added in one place.
+_COMPLETE_SESSION_NS = ns(
+    command="complete-session", session_id=None, outcome=None,
+    next_steps=[], commits=None, files_changed=[],
+)
+_LIST_SESSIONS_NS = ns(
+    command="list-sessions", project=None, status=None, since=None, limit=20,
+    include_archived=False,
+)
+_EXPORT_NS = ns(
+    command="export", target=None, export_format="markdown", output=None,
+    include_archived=False,
+)
 
 
 @pytest.fixture
@@ -47,10 +71,23 @@ def project_slug():
     return "test"
 
 
+@pytest.fixture(scope="module")
+def seed_session():
+    """Register the test project and create one session (see conftest's session_id)."""
+    def seed() -> str:
+        store.register_project("Test", "/tmp/test")
+        return store.create_session(project_slug="test", intent="CLI test").session_id
+    return seed
+
+
 @pytest.fixture
-def session_id(project_slug):
-    s = store.create_session(project_slug=project_slug, intent="CLI test")
-    return s.session_id
+def prepped(session_id) -> SimpleNamespace:
+    """Registered project (slug) + one active session (sid) in a single fixture.
+
+    The seeded snapshot already contains the project registration, so tests
+    that need both don't have to chain project_slug and session_id.
+    """
+    return SimpleNamespace(slug="test", sid=session_id)
 
 
 # ---------------------------------------------------------------------------
@@ -111,16 +148,25 @@ class TestSessionCommands:
 
     def test_complete_session(self, session_id):
         result = _dispatch(ns(
-            command="complete-session",
+            _COMPLETE_SESSION_NS,
             session_id=session_id,
             outcome="All done",
             next_steps=["Deploy"],
-            commits=None,
             files_changed=["test.py"],
         ))
         assert result["status"] == "completed"
         assert result["outcome"] == "All done"
 
+    def test_complete_session_invalid_commits_json(self, session_id):
+        result = _dispatch(ns(
+            _COMPLETE_SESSION_NS,
+            session_id=session_id,
+            outcome="All done",
+            commits='[{"sha": "abcd1234", "message": "x"',
+        ))
+        assert result["error"].startswith("Invalid commits JSON")
+        assert store.get_session(session_id).status == "active"
+
     def test_park_session(self, session_id):
         result = _dispatch(ns(
             command="park-session",
@@ -145,8 +191,8 @@ class TestSessionCommands:
         result = _dispatch(ns(command="heartbeat", session_id=session_id))
         assert result["session_id"] == session_id
 
-    def test_heartbeat_project(self, project_slug, session_id):
-        result = _dispatch(ns(command="heartbeat-project", project_slug=project_slug))
+    def test_heartbeat_project(self, prepped):
+        result = _dispatch(ns(command="heartbeat-project", project_slug=prepped.slug))
         assert result["updated"] == 1
 
 
@@ -170,6 +216,46 @@ class TestAppendCommands:
         ))
         assert len(result["commits"]) == 1
 
+    def test_capture_commits(self, session_id, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        git = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run([*git, "init", "-q"], check=True)
+        for msg in ("First", "Second"):
+            subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", msg], check=True)
+
+        args = ns(command="capture-commits", session_id=session_id, repo_path=str(repo))
+        result = _dispatch(args)
+        assert result == {"captured": 2, "total_commits": 2}
+
+        # Re-capturing is idempotent (dedup on SHA[:7])
+        result = _dispatch(args)
+        assert result == {"captured": 0, "total_commits": 2}
+
+    def test_capture_commits_hung_git_times_out(self, session_id, tmp_path, monkeypatch):
+        import manage
+
+        stub = tmp_path / "bin" / "git"
+        stub.parent.mkdir()
+        stub.write_text("#!/bin/sh\nexec sleep 30\n")
+        stub.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{stub.parent}:{os.environ['PATH']}")
+        monkeypatch.setattr(manage, "_GIT_TIMEOUT", 1)
+
+        start = time.monotonic()
+        result = _dispatch(ns(
+            command="capture-commits", session_id=session_id, repo_path=str(tmp_path),
+        ))
+        assert time.monotonic() - start < 10
+        assert result["error"].startswith("Git command failed:")
+        assert "timed out after 1 seconds" in result["error"]
+
+    def test_capture_commits_not_a_repo(self, session_id, tmp_path):
+        result = _dispatch(ns(
+            command="capture-commits", session_id=session_id, repo_path=str(tmp_path),
+        ))
+        assert "error" in result
+
     def test_add_decision(self, session_id):
         result = _dispatch(ns(
             command="add-decision",
@@ -247,14 +333,14 @@ class TestTaskCommands:
 
 
 class TestQueryCommands:
-    def test_active_sessions(self, project_slug, session_id):
-        result = _dispatch(ns(command="active-sessions", project=project_slug))
+    def test_active_sessions(self, prepped):
+        result = _dispatch(ns(command="active-sessions", project=prepped.slug))
         assert isinstance(result, list)
         assert len(result) == 1
 
-    def test_parked_sessions(self, project_slug, session_id):
-        store.park_session(session_id, reason="Break")
-        result = _dispatch(ns(command="parked-sessions", project=project_slug))
+    def test_parked_sessions(self, prepped):
+        store.park_session(prepped.sid, reason="Break")
+        result = _dispatch(ns(command="parked-sessions", project=prepped.slug))
         assert len(result) == 1
 
     def test_stale_sessions(self):
@@ -326,6 +412,7 @@ class TestQueryCommands:
         result = _dispatch(ns(command="launch-plan", path="/Users/dev/repo"))
         assert result == "MAIN"
 
+    @pytest.mark.usefixtures("store_dirs")
     def test_cleanup_locks(self):
         orphan = store.SESSIONS_DIR / "sess_orphan_0000.lock"
         orphan.touch()
@@ -334,26 +421,12 @@ class TestQueryCommands:
         assert "sess_orphan_0000.lock" in result["files"]
 
     def test_list_sessions(self, session_id):
-        result = _dispatch(ns(
-            command="list-sessions",
-            project=None,
-            status=None,
-            since=None,
-            limit=20,
-            include_archived=False,
-        ))
+        result = _dispatch(ns(_LIST_SESSIONS_NS))
         assert isinstance(result, list)
         assert len(result) >= 1
 
-    def test_list_sessions_with_filter(self, project_slug, session_id):
-        result = _dispatch(ns(
-            command="list-sessions",
-            project=project_slug,
-            status="active",
-            since=None,
-            limit=10,
-            include_archived=False,
-        ))
+    def test_list_sessions_with_filter(self, prepped):
+        result = _dispatch(ns(_LIST_SESSIONS_NS, project=prepped.slug, status="active", limit=10))
         assert len(result) == 1
 
 
@@ -398,43 +471,69 @@ class TestProjectStateCommands:
 
 
 class TestOverviewCommand:
-    def test_overview(self, project_slug, session_id):
+    def test_overview(self, prepped):
         result = _dispatch(ns(command="overview"))
         assert "projects" in result
         assert "timestamp" in result
 
 
 # ---------------------------------------------------------------------------
-# JSON output via subprocess
+# JSON output via main() + concurrent subprocess smoke runs
 # ---------------------------------------------------------------------------
 
 
-class TestCLISubprocess:
-    """Run manage.py as a subprocess to verify JSON output and exit codes."""
+_SMOKE_COMMANDS = ((), ("list-projects",))
+
 
-    def _run(self, *args, env_override=None) -> subprocess.CompletedProcess:
-        manage_py = str(Path(__file__).resolve().parent.parent / "manage.py")
+@pytest.fixture(scope="session")
+def _cli_smoke(tmp_path_factory) -> dict[tuple[str, ...], subprocess.CompletedProcess]:
+    """Run manage.py as a real subprocess per smoke command, all concurrently.
+
+    Interpreter startup dominates these runs, so they overlap in a thread pool.
+    HOME points at a temp dir so the runs never touch the real dashboard data;
+    -S skips site-packages since the CLI is stdlib-only.
+    """
+    home = tmp_path_factory.mktemp("home")
+
+    def run(args: tuple[str, ...]) -> subprocess.CompletedProcess:
         return subprocess.run(
-            [sys.executable, manage_py, *args],
+            [sys.executable, "-S", _MANAGE_PY, *args],
             capture_output=True,
             text=True,
             timeout=10,
+            env={"HOME": str(home), "PATH": "/usr/bin:/bin"},
         )
 
-    def test_no_command_shows_help(self):
-        result = self._run()
-        assert result.returncode == 1
+    with ThreadPoolExecutor(max_workers=len(_SMOKE_COMMANDS)) as pool:
+        return dict(zip(_SMOKE_COMMANDS, pool.map(run, _SMOKE_COMMANDS), strict=True))
+
 
-    def test_json_output_format(self):
-        result = self._run("list-projects")
-        assert result.returncode == 0
-        data = json.loads(result.stdout)
+class TestCLIMain:
+    """Run manage.main() in-process to verify JSON output and exit codes."""
+
+    def _run(self, monkeypatch, capsys, *args) -> str:
+        monkeypatch.setattr(sys, "argv", ["manage.py", *args])
+        main()
+        return capsys.readouterr().out
+
+    def test_no_command_shows_help(self, monkeypatch, capsys):
+        with pytest.raises(SystemExit) as exc:
+            self._run(monkeypatch, capsys)
+        assert exc.value.code == 1
+
+    @pytest.mark.slow
+    def test_entrypoint_no_command_exits_1(self, _cli_smoke):
+        assert _cli_smoke[()].returncode == 1
+
+    @pytest.mark.slow
+    def test_json_output_format(self, _cli_smoke):
+        result = _cli_smoke[("list-projects",)]
+        assert result.returncode == 0, result.stderr
+        data = _json_loads(result.stdout)
         assert isinstance(data, dict)
 
-    def test_overview_returns_json(self):
-        result = self._run("overview")
-        assert result.returncode == 0
-        data = json.loads(result.stdout)
+    def test_overview_returns_json(self, monkeypatch, capsys):
+        data = _json_loads(self._run(monkeypatch, capsys, "overview"))
         assert "projects" in data
 
 
@@ -450,58 +549,39 @@ class TestCLISubprocess:
 
 class TestExportCommands:
     def test_export_session_json(self, session_id):
-        result = _dispatch(ns(
-            command="export", target=session_id,
-            export_format="json", output=None, include_archived=False,
-        ))
+        result = _dispatch(ns(_EXPORT_NS, target=session_id, export_format="json"))
         assert result["session_id"] == session_id
         assert "task_summary" in result
         assert "duration" in result
 
     def test_export_session_markdown(self, session_id):
-        result = _dispatch(ns(
-            command="export", target=session_id,
-            export_format="markdown", output=None, include_archived=False,
-        ))
+        result = _dispatch(ns(_EXPORT_NS, target=session_id, export_format="markdown"))
         assert isinstance(result, str)
         assert "# Session:" in result
         assert "CLI test" in result
 
     def test_export_session_not_found(self):
-        result = _dispatch(ns(
-            command="export", target="sess_20000101T0000_0000",
-            export_format="json", output=None, include_archived=False,
-        ))
+        result = _dispatch(ns(_EXPORT_NS, target="sess_20000101T0000_0000", export_format="json"))
         assert "error" in result
 
-    def test_export_project_json(self, project_slug, session_id):
-        result = _dispatch(ns(
-            command="export", target=project_slug,
-            export_format="json", output=None, include_archived=False,
-        ))
-        assert result["project"] == project_slug
+    def test_export_project_json(self, prepped):
+        result = _dispatch(ns(_EXPORT_NS, target=prepped.slug, export_format="json"))
+        assert result["project"] == prepped.slug
         assert result["session_count"] >= 1
 
-    def test_export_project_markdown(self, project_slug, session_id):
-        result = _dispatch(ns(
-            command="export", target=project_slug,
-            export_format="markdown", output=None, include_archived=False,
-        ))
+    def test_export_project_markdown(self, prepped):
+        result = _dispatch(ns(_EXPORT_NS, target=prepped.slug, export_format="markdown"))
         assert isinstance(result, str)
         assert "# Project:" in result
 
     def test_export_project_not_found(self):
-        result = _dispatch(ns(
-            command="export", target="nonexistent",
-            export_format="json", output=None, include_archived=False,
-        ))
+        result = _dispatch(ns(_EXPORT_NS, target="nonexistent", export_format="json"))
         assert "error" in result
 
     def test_export_to_file(self, session_id, tmp_path):
         outfile = str(tmp_path / "export.md")
         result = _dispatch(ns(
-            command="export", target=session_id,
-            export_format="markdown", output=outfile, include_archived=False,
+            _EXPORT_NS, target=session_id, export_format="markdown", output=outfile,
         ))
         assert result["status"] == "exported"
         content = Path(outfile).read_text()
@@ -522,7 +602,7 @@ class TestCheckNotify:
 
     def test_enabled_returns_checked(self):
         config = store.load_config()
-        config.settings.notifications_enabled = True
+        config.settings = replace(config.settings, notifications_enabled=True)
         store.save_config(config)
 
         result = _dispatch(ns(command="check-notify"))
@@ -535,13 +615,37 @@ class TestCheckNotify:
 
 
 class TestRebuildIndex:
-    def test_rebuild_index_command(self):
+    @pytest.fixture
+    def _two_sessions_no_index(self):
         store.create_session(project_slug="test", intent="Session 1")
         store.create_session(project_slug="test", intent="Session 2")
-
         # Delete index to force rebuild
         store._index_path().unlink()
 
+    @pytest.mark.usefixtures("_two_sessions_no_index")
+    def test_rebuild_index_command(self):
         result = _dispatch(ns(command="rebuild-index"))
         assert result["status"] == "rebuilt"
         assert result["entries"] == 2
+
+
+# ---------------------------------------------------------------------------
+# serve
+# ---------------------------------------------------------------------------
+
+
+class TestServe:
+    def test_serves_web_app_as_package(self, monkeypatch):
+        uvicorn = pytest.importorskip("uvicorn")
+        from uvicorn.importer import import_from_string
+
+        import manage
+        from web.app import app
+
+        calls = []
+        monkeypatch.setattr(uvicorn, "run", lambda target, **kw: calls.append((target, kw)))
+        manage._serve("127.0.0.1", 9000)
+
+        (target, kwargs), = calls
+        assert kwargs["app_dir"] == str(Path(manage.__file__).parent)
+        assert import_from_string(target) is app
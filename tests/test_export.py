@@ -6,6 +6,10 @@ without any file I/O. All inputs are constructed in-memory.
 
 from __future__ import annotations
 
+from types import MappingProxyType
+
+import pytest
+
 from lib.export import (
     _format_duration,
     _format_iso_short,
@@ -13,6 +17,7 @@ from lib.export import (
     export_project_markdown,
     export_session_json,
     export_session_markdown,
+    iter_project_markdown,
 )
 from lib.models import Session, SessionStatus, TaskStatus
 
@@ -21,19 +26,28 @@ from lib.models import Session, SessionStatus, TaskStatus
 # ---------------------------------------------------------------------------
 
 
+_SESSION_DEFAULTS = MappingProxyType({
+    "session_id": "sess_20260228T1000_abcd",
+    "project_slug": "test-project",
+    "status": SessionStatus.COMPLETED,
+    "intent": "Build export feature",
+    "started_at": "2026-02-28T10:00:00+00:00",
+    "last_heartbeat": "2026-02-28T12:15:00+00:00",
+    "ended_at": "2026-02-28T12:15:00+00:00",
+    "git_branch": "main",
+})
+
+
 def _make_session(**overrides) -> Session:
-    defaults = {
-        "session_id": "sess_20260228T1000_abcd",
-        "project_slug": "test-project",
-        "status": SessionStatus.COMPLETED,
-        "intent": "Build export feature",
-        "started_at": "2026-02-28T10:00:00+00:00",
-        "last_heartbeat": "2026-02-28T12:15:00+00:00",
-        "ended_at": "2026-02-28T12:15:00+00:00",
-        "git_branch": "main",
-    }
-    defaults.update(overrides)
-    return Session(**defaults)
+    # Deliberately a fresh Session per call rather than replace() on a prototype:
+    # Session is a plain dataclass (no validation to skip), and replace() would
+    # share the prototype's list fields (tasks, commits, ...) between sessions.
+    return Session(**(_SESSION_DEFAULTS | overrides))
+
+
+def _md_lines(md: str) -> set[str]:
+    """Split rendered markdown once so heading checks are set lookups."""
+    return set(md.splitlines())
 
 
 # ---------------------------------------------------------------------------
@@ -42,38 +56,24 @@ def _make_session(**overrides) -> Session:
 
 
 class TestFormatDuration:
-    def test_hours_and_minutes(self):
-        assert _format_duration(
-            "2026-02-28T10:00:00+00:00",
-            "2026-02-28T12:15:00+00:00",
-        ) == "2u 15m"
-
-    def test_only_hours(self):
-        assert _format_duration(
-            "2026-02-28T10:00:00+00:00",
-            "2026-02-28T13:00:00+00:00",
-        ) == "3u"
-
-    def test_only_minutes(self):
-        assert _format_duration(
-            "2026-02-28T10:00:00+00:00",
-            "2026-02-28T10:45:00+00:00",
-        ) == "45m"
-
-    def test_zero_minutes(self):
-        assert _format_duration(
-            "2026-02-28T10:00:00+00:00",
-            "2026-02-28T10:00:00+00:00",
-        ) == "0m"
-
-    def test_missing_start(self):
-        assert _format_duration(None, "2026-02-28T10:00:00+00:00") == ""
-
-    def test_missing_end(self):
-        assert _format_duration("2026-02-28T10:00:00+00:00", None) == ""
-
-    def test_invalid_iso(self):
-        assert _format_duration("not-a-date", "also-not") == ""
+    @pytest.mark.parametrize(
+        ("start", "end", "expected"),
+        [
+            ("2026-02-28T10:00:00+00:00", "2026-02-28T12:15:00+00:00", "2u 15m"),
+            ("2026-02-28T10:00:00+00:00", "2026-02-28T13:00:00+00:00", "3u"),
+            ("2026-02-28T10:00:00+00:00", "2026-02-28T10:45:00+00:00", "45m"),
+            ("2026-02-28T10:00:00+00:00", "2026-02-28T10:00:00+00:00", "0m"),
+            (None, "2026-02-28T10:00:00+00:00", ""),
+            ("2026-02-28T10:00:00+00:00", None, ""),
+            ("not-a-date", "also-not", ""),
+        ],
+        ids=[
+            "hours_and_minutes", "only_hours", "only_minutes", "zero_minutes",
+            "missing_start", "missing_end", "invalid_iso",
+        ],
+    )
+    def test_format_duration(self, start, end, expected):
+        assert _format_duration(start, end) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -82,18 +82,18 @@ class TestFormatDuration:
 
 
 class TestFormatIsoShort:
-    def test_formats_correctly(self):
-        result = _format_iso_short("2026-02-28T10:00:00+00:00")
-        assert result == "2026-02-28 10:00"
-
-    def test_none_returns_empty(self):
-        assert _format_iso_short(None) == ""
-
-    def test_empty_string_returns_empty(self):
-        assert _format_iso_short("") == ""
-
-    def test_invalid_returns_empty(self):
-        assert _format_iso_short("bad") == ""
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2026-02-28T10:00:00+00:00", "2026-02-28 10:00"),
+            (None, ""),
+            ("", ""),
+            ("bad", ""),
+        ],
+        ids=["formats_correctly", "none", "empty_string", "invalid"],
+    )
+    def test_format_iso_short(self, value, expected):
+        assert _format_iso_short(value) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -140,66 +140,75 @@ class TestExportSessionMarkdown:
         md = export_session_markdown(_make_session())
         assert md.startswith("# Session: Build export feature")
 
-    def test_metadata_table(self):
-        md = export_session_markdown(_make_session())
-        assert "| Session ID |" in md
-        assert "| Status | completed |" in md
-        assert "| Duration | 2u 15m |" in md
-
-    def test_outcome_section(self):
-        md = export_session_markdown(_make_session(outcome="All tests pass"))
-        assert "## Outcome" in md
-        assert "All tests pass" in md
-
-    def test_parked_reason_section(self):
-        md = export_session_markdown(_make_session(
-            status=SessionStatus.PARKED,
-            parked_reason="Waiting for review",
-        ))
-        assert "## Parked reason" in md
-        assert "Waiting for review" in md
-
-    def test_tasks_as_checkboxes(self):
-        session = _make_session(tasks=[
-            {"id": "t1", "subject": "Write tests", "status": TaskStatus.COMPLETED},
-            {"id": "t2", "subject": "Write docs", "status": TaskStatus.PENDING},
-            {"id": "t3", "subject": "Refactor", "status": TaskStatus.IN_PROGRESS},
-            {"id": "t4", "subject": "Old task", "status": TaskStatus.SKIPPED},
-        ])
-        md = export_session_markdown(session)
-        assert "## Tasks (1/4)" in md
-        assert "- [x] Write tests" in md
-        assert "- [ ] Write docs" in md
-        assert "*(in progress)*" in md
-        assert "~~Old task~~" in md
-        assert "(skipped)" in md
-
-    def test_decisions_section(self):
-        md = export_session_markdown(_make_session(decisions=["Use JSON", "No ORM"]))
-        assert "## Decisions" in md
-        assert "- Use JSON" in md
-
-    def test_commits_section(self):
-        session = _make_session(commits=[
-            {"sha": "abc1234567890", "message": "feat: add export"},
-        ])
-        md = export_session_markdown(session)
-        assert "## Commits" in md
-        assert "`abc1234`" in md
-        assert "feat: add export" in md
-
-    def test_events_section(self):
-        session = _make_session(events=[
-            {"timestamp": "2026-02-28T10:30:00+00:00", "message": "Started coding"},
-        ])
-        md = export_session_markdown(session)
-        assert "## Events" in md
-        assert "Started coding" in md
-
-    def test_next_steps_section(self):
-        md = export_session_markdown(_make_session(next_steps=["Deploy", "Monitor"]))
-        assert "## Next steps" in md
-        assert "- Deploy" in md
+    @pytest.mark.parametrize(
+        ("overrides", "expected"),
+        [
+            pytest.param(
+                {},
+                ["| Session ID |", "| Status | completed |", "| Duration | 2u 15m |"],
+                id="metadata_table",
+            ),
+            pytest.param(
+                {"roadmap_ref": "D4"}, ["| Roadmap ref | D4 |"], id="roadmap_ref_in_metadata",
+            ),
+            pytest.param(
+                {"outcome": "All tests pass"}, ["## Outcome", "All tests pass"], id="outcome",
+            ),
+            pytest.param(
+                {"status": SessionStatus.PARKED, "parked_reason": "Waiting for review"},
+                ["## Parked reason", "Waiting for review"],
+                id="parked_reason",
+            ),
+            pytest.param(
+                {"tasks": [
+                    {"id": "t1", "subject": "Write tests", "status": TaskStatus.COMPLETED},
+                    {"id": "t2", "subject": "Write docs", "status": TaskStatus.PENDING},
+                    {"id": "t3", "subject": "Refactor", "status": TaskStatus.IN_PROGRESS},
+                    {"id": "t4", "subject": "Old task", "status": TaskStatus.SKIPPED},
+                ]},
+                [
+                    "## Tasks (1/4)", "- [x] Write tests", "- [ ] Write docs",
+                    "*(in progress)*", "~~Old task~~", "(skipped)",
+                ],
+                id="tasks_as_checkboxes",
+            ),
+            pytest.param(
+                {"decisions": ["Use JSON", "No ORM"]}, ["## Decisions", "- Use JSON"],
+                id="decisions",
+            ),
+            pytest.param(
+                {"commits": [{"sha": "abc1234567890", "message": "feat: add export"}]},
+                ["## Commits", "`abc1234`", "feat: add export"],
+                id="commits",
+            ),
+            pytest.param(
+                {"events": [
+                    {"timestamp": "2026-02-28T10:30:00+00:00", "message": "Started coding"},
+                ]},
+                ["## Events", "Started coding"],
+                id="events",
+            ),
+            pytest.param(
+                {"next_steps": ["Deploy", "Monitor"]}, ["## Next steps", "- Deploy"],
+                id="next_steps",
+            ),
+            pytest.param(
+                {"files_changed": ["lib/export.py"]}, ["## Files changed", "`lib/export.py`"],
+                id="files_changed",
+            ),
+            pytest.param(
+                {"open_questions": ["What about edge cases?"]},
+                ["## Open questions", "- What about edge cases?"],
+                id="open_questions",
+            ),
+        ],
+    )
+    def test_section_rendered(self, overrides, expected):
+        md = export_session_markdown(_make_session(**overrides))
+        lines = _md_lines(md)
+        for text in expected:
+            # Headings must be a full line; other expectations may be inline.
+            assert text in lines if text.startswith("#") else text in md
 
     def test_empty_sections_omitted(self):
         session = _make_session()  # no tasks, decisions, commits, etc.
@@ -211,24 +220,10 @@ class TestExportSessionMarkdown:
         assert "## Next steps" not in md
         assert "## Open questions" not in md
 
-    def test_roadmap_ref_in_metadata(self):
-        md = export_session_markdown(_make_session(roadmap_ref="D4"))
-        assert "| Roadmap ref | D4 |" in md
-
     def test_no_roadmap_ref_row_when_none(self):
         md = export_session_markdown(_make_session(roadmap_ref=None))
         assert "Roadmap ref" not in md
 
-    def test_files_changed_section(self):
-        md = export_session_markdown(_make_session(files_changed=["lib/export.py"]))
-        assert "## Files changed" in md
-        assert "`lib/export.py`" in md
-
-    def test_open_questions_section(self):
-        md = export_session_markdown(_make_session(open_questions=["What about edge cases?"]))
-        assert "## Open questions" in md
-        assert "- What about edge cases?" in md
-
 
 # ---------------------------------------------------------------------------
 # export_project_json
@@ -281,3 +276,15 @@ class TestExportProjectMarkdown:
         md = export_project_markdown("empty", [])
         assert "# Project: empty" in md
         assert "**Sessions:** 0" in md
+
+    def test_chunks_join_to_document(self):
+        first = _make_session(intent="First")
+        second = _make_session(session_id="sess_20260228T1100_efgh", intent="Second")
+        chunks = list(iter_project_markdown("proj", [first, second]))
+        assert len(chunks) == 3  # header + one per session
+        assert "".join(chunks) == (
+            "# Project: proj\n\n**Sessions:** 2\n\n---\n\n"
+            + export_session_markdown(first, heading_level=2)
+            + "\n---\n\n"
+            + export_session_markdown(second, heading_level=2)
+        )
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-import re
-from dataclasses import asdict
+import json
+from dataclasses import FrozenInstanceError, asdict, replace
+
+import pytest
 
 from lib.models import (
+    SESSION_ID_RE,
     DashboardConfig,
     DashboardSettings,
     ProjectRegistration,
@@ -14,6 +17,7 @@ from lib.models import (
     Session,
     SessionStatus,
     generate_session_id,
+    is_valid_session_id,
 )
 
 # --- SessionStatus StrEnum ---
@@ -28,11 +32,26 @@ class TestSessionStatus:
     def test_is_string(self):
         assert isinstance(SessionStatus.ACTIVE, str)
 
+    def test_behaves_as_plain_string(self):
+        # Hot paths compare and look up statuses as raw strings.
+        assert hash(SessionStatus.PARKED) == hash("parked")
+        assert {"parked": 1}[SessionStatus.PARKED] == 1
+        assert SessionStatus.ACTIVE in {"active", "parked"}
+        assert json.dumps(SessionStatus.COMPLETED) == '"completed"'
+
     def test_from_string(self):
         assert SessionStatus("active") is SessionStatus.ACTIVE
         assert SessionStatus("completed") is SessionStatus.COMPLETED
         assert SessionStatus("parked") is SessionStatus.PARKED
 
+    def test_from_str(self):
+        for member in SessionStatus:
+            assert SessionStatus.from_str(member.value) is member
+
+    def test_from_str_rejects_unknown(self):
+        with pytest.raises(ValueError, match="not a valid SessionStatus"):
+            SessionStatus.from_str("archived")
+
     def test_all_members(self):
         assert set(SessionStatus) == {
             SessionStatus.ACTIVE,
@@ -45,11 +64,9 @@ class TestSessionStatus:
 
 
 class TestGenerateSessionId:
-    ID_PATTERN = re.compile(r"^sess_\d{8}T\d{4}_[0-9a-f]{4}$")
-
     def test_format(self):
         sid = generate_session_id()
-        assert self.ID_PATTERN.match(sid), f"ID format mismatch: {sid}"
+        assert SESSION_ID_RE.fullmatch(sid), f"ID format mismatch: {sid}"
 
     def test_prefix(self):
         sid = generate_session_id()
@@ -59,12 +76,34 @@ class TestGenerateSessionId:
         ids = {generate_session_id() for _ in range(50)}
         assert len(ids) == 50, "Expected 50 unique IDs"
 
+    def test_same_minute_suffix_counts_up(self):
+        a, b = generate_session_id(), generate_session_id()
+        if a.rsplit("_", 1)[0] != b.rsplit("_", 1)[0]:
+            pytest.skip("minute boundary crossed")
+        step = (int(b.rsplit("_", 1)[1], 16) - int(a.rsplit("_", 1)[1], 16)) & 0xFFFF
+        assert step == 1
+
     def test_suffix_is_hex(self):
         sid = generate_session_id()
         suffix = sid.rsplit("_", 1)[1]
         int(suffix, 16)  # raises ValueError if not hex
 
 
+class TestIsValidSessionId:
+    def test_generated_id_is_valid(self):
+        assert is_valid_session_id(generate_session_id())
+
+    @pytest.mark.parametrize("bad", [
+        "sess_20260101T0000_abcd\n",
+        "sess_20260101T0000_ABCD",
+        "sess_2026010\u0661T0000_abcd",  # Arabic-Indic digit one
+        "../sess_20260101T0000_abcd",
+        "",
+    ])
+    def test_rejects(self, bad):
+        assert not is_valid_session_id(bad)
+
+
 # --- Session dataclass ---
 
 
@@ -110,6 +149,22 @@ class TestSession:
         s1.events.append({"msg": "test"})
         assert s2.events == [], "Mutable default should not be shared"
 
+    def test_slotted_instance_has_no_dict(self):
+        s = Session(session_id="a", project_slug="p", status=SessionStatus.ACTIVE, intent="i")
+        assert not hasattr(s, "__dict__")
+        with pytest.raises(AttributeError):
+            s.not_a_field = 1
+
+    def test_repeated_labels_are_interned(self):
+        # Build equal strings at runtime so they start out as distinct objects.
+        slug, branch = "".join(["my-", "project"]), "".join(["feat/", "x"])
+        s1 = Session(session_id="a", project_slug=slug, status=SessionStatus.ACTIVE, intent="i",
+                     git_branch=branch)
+        s2 = Session(session_id="b", project_slug="my-project", status=SessionStatus.ACTIVE,
+                     intent="i", git_branch="feat/x")
+        assert s1.project_slug is s2.project_slug
+        assert s1.git_branch is s2.git_branch
+
     def test_serialization_roundtrip(self):
         s = Session(
             session_id="sess_20260101T0000_abcd",
@@ -127,7 +182,7 @@ class TestSession:
             git_branch="feature/auth",
             tasks=[{"title": "Fix login", "status": "pending"}],
         )
-        d = asdict(s)
+        d = s.to_dict()
         assert d["session_id"] == "sess_20260101T0000_abcd"
         assert d["status"] == "parked"
         assert d["parked_reason"] == "Wacht op feedback"
@@ -135,9 +190,31 @@ class TestSession:
         assert d["tasks"] == [{"title": "Fix login", "status": "pending"}]
 
         # Reconstruct from dict
-        d["status"] = SessionStatus(d["status"])
-        s2 = Session(**d)
+        s2 = Session.from_dict(d)
         assert s2 == s
+        assert s2.status is SessionStatus.PARKED
+
+    def test_from_dict_ignores_unknown_keys(self):
+        d = {
+            "session_id": "x", "project_slug": "p", "status": "active", "intent": "i",
+            "schema_version": 4, "some_future_field": True,
+        }
+        s = Session.from_dict(d)
+        assert s.intent == "i"
+        assert s.tasks == []
+
+    def test_from_dict_defaults_are_fresh_and_required_keys_enforced(self):
+        base = {"session_id": "x", "project_slug": "p", "status": "active", "intent": "i"}
+        s1, s2 = Session.from_dict(base), Session.from_dict(base)
+        assert s1 == Session(session_id="x", project_slug="p", status=SessionStatus.ACTIVE,
+                             intent="i")
+        assert s1.events is not s2.events
+        with pytest.raises(KeyError):
+            Session.from_dict({k: v for k, v in base.items() if k != "intent"})
+
+    def test_field_names_cached(self):
+        assert Session._FIELD_NAMES[:4] == ("session_id", "project_slug", "status", "intent")
+        assert "_FIELD_NAMES" not in Session._FIELD_NAMES
 
     def test_status_serializes_as_string(self):
         s = Session(
@@ -146,10 +223,29 @@ class TestSession:
             status=SessionStatus.COMPLETED,
             intent="i",
         )
-        d = asdict(s)
+        d = s.to_dict()
         assert d["status"] == "completed"
         assert isinstance(d["status"], str)
 
+    def test_to_dict_matches_asdict(self):
+        """to_dict() lists fields by hand — guard it against drifting from the dataclass."""
+        s = Session(
+            session_id="x",
+            project_slug="p",
+            status=SessionStatus.ACTIVE,
+            intent="i",
+            events=[{"message": "e"}],
+            commits=[{"sha": "abcd", "message": "m"}],
+            tasks=[{"id": "t1", "subject": "s", "status": "pending"}],
+        )
+        assert s.to_dict() == asdict(s)
+        assert list(s.to_dict()) == list(asdict(s))
+
+    def test_to_dict_copies_lists(self):
+        s = Session(session_id="x", project_slug="p", status=SessionStatus.ACTIVE, intent="i")
+        s.to_dict()["events"].append({"message": "e"})
+        assert s.events == []
+
 
 # --- ProjectRegistration ---
 
@@ -166,8 +262,8 @@ class TestProjectRegistration:
 
     def test_serialization_roundtrip(self):
         pr = ProjectRegistration(name="P", path="/tmp/p", registered_at="2026-01-01T00:00:00+00:00")
-        d = asdict(pr)
-        pr2 = ProjectRegistration(**d)
+        d = pr.to_dict()
+        pr2 = ProjectRegistration.from_dict(d)
         assert pr2 == pr
 
 
@@ -187,8 +283,8 @@ class TestRoadmapSummary:
             in_progress=["A2"],
             next_up=["A3", "A4", "A5"],
         )
-        d = asdict(rs)
-        rs2 = RoadmapSummary(**d)
+        d = rs.to_dict()
+        rs2 = RoadmapSummary.from_dict(d)
         assert rs2 == rs
 
 
@@ -211,10 +307,9 @@ class TestProjectState:
             active_sessions=2,
             total_sessions=5,
         )
-        d = asdict(ps)
-        # Reconstruct nested dataclass
-        d["roadmap_summary"] = RoadmapSummary(**d["roadmap_summary"])
-        ps2 = ProjectState(**d)
+        d = ps.to_dict()
+        assert d == asdict(ps)
+        ps2 = ProjectState.from_dict(d)
         assert ps2 == ps
 
 
@@ -228,6 +323,13 @@ class TestDashboardSettings:
         assert ds.stale_threshold_hours == 24
         assert ds.archive_after_days == 30
 
+    def test_frozen_and_hashable(self):
+        ds = DashboardSettings()
+        with pytest.raises(FrozenInstanceError):
+            ds.dashboard_port = 8080
+        assert hash(ds) == hash(DashboardSettings())
+        assert replace(ds, dashboard_port=8080).dashboard_port == 8080
+
 
 # --- DashboardConfig ---
 
@@ -251,6 +353,13 @@ class TestDashboardConfig:
             },
             settings=DashboardSettings(dashboard_port=8080),
         )
-        d = asdict(dc)
+        d = dc.to_dict()
+        assert d == asdict(dc)
         assert d["projects"]["my-proj"]["name"] == "My Proj"
         assert d["settings"]["dashboard_port"] == 8080
+        assert DashboardConfig.from_dict(d) == dc
+
+    def test_from_dict_tolerates_unknown_settings(self):
+        dc = DashboardConfig.from_dict({"settings": {"dashboard_port": 8080, "removed_opt": 1}})
+        assert dc.settings.dashboard_port == 8080
+        assert dc.projects == {}
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
+import time
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
@@ -11,7 +14,8 @@ import pytest
 from lib import store
 from lib.notify import (
     _escape_applescript,
-    _load_notify_state,
+    _migrate_notify_state,
+    _read_notify_state,
     _save_notify_state,
     _send_notification,
     _should_notify,
@@ -25,18 +29,18 @@ from lib.notify import (
 
 
 @pytest.fixture(autouse=True)
-def _isolate(tmp_path, monkeypatch):
-    """Redirect store + notify state paths to temp directory."""
-    monkeypatch.setattr(store, "DASHBOARD_DIR", tmp_path)
-    monkeypatch.setattr(store, "SESSIONS_DIR", tmp_path / "sessions")
-    monkeypatch.setattr(store, "ARCHIVE_DIR", tmp_path / "sessions" / "archive")
-    monkeypatch.setattr(store, "PROJECTS_DIR", tmp_path / "projects")
-    monkeypatch.setattr(store, "CONFIG_PATH", tmp_path / "config.json")
-    # Redirect notify state to tmp
+def _isolate(store_root, monkeypatch):
+    """Start on an empty store (see conftest) and redirect notify state into it."""
     import lib.notify as notify_mod
 
-    monkeypatch.setattr(notify_mod, "NOTIFY_STATE_PATH", tmp_path / "notify_state.json")
-    store._ensure_dirs()
+    monkeypatch.setattr(notify_mod, "NOTIFY_STATE_PATH", store_root / "notify_state.json")
+
+
+def _configure(**settings):
+    """Persist config with the given settings overridden (settings are frozen)."""
+    config = store.load_config()
+    config.settings = replace(config.settings, **settings)
+    store.save_config(config)
 
 
 @pytest.fixture
@@ -62,6 +66,15 @@ class TestSendNotification:
             args = mock_run.call_args
             assert args[0][0][0] == "osascript"
 
+    def test_macos_script_escapes_title_and_message(self):
+        with (
+            patch("lib.notify.platform.system", return_value="Darwin"),
+            patch("lib.notify.subprocess.run") as mock_run,
+        ):
+            _send_notification('T "x"', "M\\y")
+        script = mock_run.call_args[0][0][2]
+        assert script == 'display notification "M\\\\y" with title "T \\"x\\""'
+
     def test_non_macos_logs_only(self):
         with patch("lib.notify.platform.system", return_value="Linux"):
             result = _send_notification("Title", "Message")
@@ -94,6 +107,9 @@ class TestEscapeApplescript:
     def test_plain_text_unchanged(self):
         assert _escape_applescript("hello world") == "hello world"
 
+    def test_backslash_before_quote_not_double_escaped(self):
+        assert _escape_applescript('a\\"b') == 'a\\\\\\"b'
+
 
 # ---------------------------------------------------------------------------
 # Notify state persistence
@@ -102,7 +118,7 @@ class TestEscapeApplescript:
 
 class TestNotifyState:
     def test_load_empty_returns_dict(self):
-        state = _load_notify_state()
+        state = _read_notify_state()
         assert state == {}
 
     def test_save_and_load_roundtrip(self, tmp_path, monkeypatch):
@@ -111,12 +127,27 @@ class TestNotifyState:
         path = tmp_path / "notify_state.json"
         monkeypatch.setattr(notify_mod, "NOTIFY_STATE_PATH", path)
 
-        data = {"sess_123": {"reason": "stale", "notified_at": "2026-01-01T00:00:00"}}
+        data = {"sess_123": {"reason": "stale", "notified_at": 1767225600.5}}
         _save_notify_state(data)
 
-        loaded = _load_notify_state()
+        loaded = _read_notify_state()
         assert loaded == data
 
+    def test_legacy_iso_notified_at_migrated_to_epoch(self, tmp_path, monkeypatch):
+        import lib.notify as notify_mod
+
+        path = tmp_path / "notify_state.json"
+        monkeypatch.setattr(notify_mod, "NOTIFY_STATE_PATH", path)
+        path.write_text(json.dumps({
+            "sess_1": {"reason": "stale", "notified_at": "2026-01-01T00:00:00+00:00"},
+            "sess_2": {"reason": "parked", "notified_at": "not a date"},
+        }))
+
+        state = _read_notify_state()
+        assert _migrate_notify_state(state) is True
+        assert state["sess_1"]["notified_at"] == datetime(2026, 1, 1, tzinfo=UTC).timestamp()
+        assert "notified_at" not in state["sess_2"]
+
     def test_corrupt_file_returns_empty(self, tmp_path, monkeypatch):
         import lib.notify as notify_mod
 
@@ -124,9 +155,18 @@ class TestNotifyState:
         monkeypatch.setattr(notify_mod, "NOTIFY_STATE_PATH", path)
         path.write_text("not json{{{")
 
-        state = _load_notify_state()
+        state = _read_notify_state()
         assert state == {}
 
+    def test_invalid_utf8_returns_empty(self, tmp_path, monkeypatch):
+        import lib.notify as notify_mod
+
+        path = tmp_path / "notify_state.json"
+        monkeypatch.setattr(notify_mod, "NOTIFY_STATE_PATH", path)
+        path.write_bytes(b'{"sess_1": "\xff"}')
+
+        assert _read_notify_state() == {}
+
 
 # ---------------------------------------------------------------------------
 # _should_notify (cooldown logic)
@@ -138,18 +178,15 @@ class TestShouldNotify:
         assert _should_notify("sess_1", "stale", {}, cooldown_hours=12) is True
 
     def test_within_cooldown_skips(self):
-        now = datetime.now(UTC).isoformat()
-        state = {"sess_1": {"reason": "stale", "notified_at": now}}
+        state = {"sess_1": {"reason": "stale", "notified_at": time.time() - 3600}}
         assert _should_notify("sess_1", "stale", state, cooldown_hours=12) is False
 
     def test_after_cooldown_notifies(self):
-        old = (datetime.now(UTC) - timedelta(hours=13)).isoformat()
-        state = {"sess_1": {"reason": "stale", "notified_at": old}}
+        state = {"sess_1": {"reason": "stale", "notified_at": time.time() - 13 * 3600}}
         assert _should_notify("sess_1", "stale", state, cooldown_hours=12) is True
 
     def test_reason_changed_notifies(self):
-        now = datetime.now(UTC).isoformat()
-        state = {"sess_1": {"reason": "stale", "notified_at": now}}
+        state = {"sess_1": {"reason": "stale", "notified_at": time.time()}}
         assert _should_notify("sess_1", "parked", state, cooldown_hours=12) is True
 
 
@@ -195,12 +232,14 @@ class TestCheckAndNotify:
         assert result["stale_notified"] == 0
         assert result["parked_notified"] == 0
 
+    def test_disabled_skips_session_load(self):
+        with patch("lib.store.list_sessions", side_effect=AssertionError("sessions loaded")):
+            result = check_and_notify()
+        assert result["status"] == "disabled"
+
     def test_stale_session_notified(self, project_slug):
         # Enable notifications
-        config = store.load_config()
-        config.settings.notifications_enabled = True
-        config.settings.stale_threshold_hours = 1
-        store.save_config(config)
+        _configure(notifications_enabled=True, stale_threshold_hours=1)
 
         # Create session and backdate heartbeat
         s = store.create_session(project_slug=project_slug, intent="Stale test")
@@ -216,10 +255,7 @@ class TestCheckAndNotify:
         assert "Stale sessie" in mock_send.call_args[0][0]
 
     def test_parked_session_notified(self, project_slug):
-        config = store.load_config()
-        config.settings.notifications_enabled = True
-        config.settings.parked_notify_hours = 1
-        store.save_config(config)
+        _configure(notifications_enabled=True, parked_notify_hours=1)
 
         s = store.create_session(project_slug=project_slug, intent="Parked test")
         store.park_session(s.session_id, reason="Break")
@@ -232,12 +268,28 @@ class TestCheckAndNotify:
         assert result["parked_notified"] == 1
         mock_send.assert_called_once()
 
+    def test_batch_counts_only_delivered(self, project_slug):
+        _configure(notifications_enabled=True, stale_threshold_hours=1)
+        old_hb = (datetime.now(UTC) - timedelta(hours=2)).isoformat()
+        ids = {}
+        for intent in ("deliver-a", "fail", "deliver-b"):
+            s = store.create_session(project_slug=project_slug, intent=intent)
+            store.update_session(s.session_id, last_heartbeat=old_hb)
+            ids[intent] = s.session_id
+
+        with patch(
+            "lib.notify._send_notification", side_effect=lambda _t, msg: "fail" not in msg,
+        ) as mock_send:
+            result = check_and_notify()
+
+        assert mock_send.call_count == 3
+        assert result["stale_notified"] == 2
+        state = _read_notify_state()
+        assert ids["fail"] not in state
+        assert {ids["deliver-a"], ids["deliver-b"]} <= state.keys()
+
     def test_dedup_within_cooldown(self, project_slug):
-        config = store.load_config()
-        config.settings.notifications_enabled = True
-        config.settings.stale_threshold_hours = 1
-        config.settings.notify_cooldown_hours = 12
-        store.save_config(config)
+        _configure(notifications_enabled=True, stale_threshold_hours=1, notify_cooldown_hours=12)
 
         s = store.create_session(project_slug=project_slug, intent="Dedup test")
         old_hb = (datetime.now(UTC) - timedelta(hours=2)).isoformat()
@@ -253,11 +305,50 @@ class TestCheckAndNotify:
         assert result["stale_notified"] == 0
         mock_send.assert_not_called()
 
+    def test_loads_config_once(self, project_slug):
+        _configure(notifications_enabled=True)
+
+        original = store.load_config
+        with (
+            patch("lib.notify.load_config", wraps=original) as notify_load,
+            patch("lib.store.load_config", wraps=original) as store_load,
+        ):
+            check_and_notify()
+
+        assert notify_load.call_count + store_load.call_count == 1
+
+    def test_unchanged_state_not_rewritten(self, project_slug):
+        _configure(notifications_enabled=True)
+        store.create_session(project_slug=project_slug, intent="Fresh session")
+
+        with patch("lib.notify._save_notify_state") as mock_save:
+            result = check_and_notify()
+
+        assert result["status"] == "checked"
+        mock_save.assert_not_called()
+
+    def test_migrated_legacy_state_persisted(self, project_slug):
+        import lib.notify as notify_mod
+
+        _configure(notifications_enabled=True, stale_threshold_hours=1, notify_cooldown_hours=12)
+        s = store.create_session(project_slug=project_slug, intent="Legacy state")
+        old_hb = (datetime.now(UTC) - timedelta(hours=2)).isoformat()
+        store.update_session(s.session_id, last_heartbeat=old_hb)
+        notified = datetime.now(UTC) - timedelta(hours=1)
+        notify_mod.NOTIFY_STATE_PATH.write_text(json.dumps({
+            s.session_id: {"reason": "stale", "notified_at": notified.isoformat()},
+        }))
+
+        # Within cooldown: nothing is sent, but the epoch conversion is written back
+        with patch("lib.notify._send_notification", return_value=True) as mock_send:
+            check_and_notify()
+
+        mock_send.assert_not_called()
+        on_disk = json.loads(notify_mod.NOTIFY_STATE_PATH.read_text())
+        assert on_disk[s.session_id]["notified_at"] == notified.timestamp()
+
     def test_cleanup_resolved_entries(self, project_slug):
-        config = store.load_config()
-        config.settings.notifications_enabled = True
-        config.settings.stale_threshold_hours = 1
-        store.save_config(config)
+        _configure(notifications_enabled=True, stale_threshold_hours=1)
 
         s = store.create_session(project_slug=project_slug, intent="Cleanup test")
         old_hb = (datetime.now(UTC) - timedelta(hours=2)).isoformat()
@@ -273,5 +364,5 @@ class TestCheckAndNotify:
             check_and_notify()
 
         # State entry should be cleaned up
-        state = _load_notify_state()
+        state = _read_notify_state()
         assert s.session_id not in state
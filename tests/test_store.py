@@ -1,20 +1,27 @@
 """Tests for lib/store.py — CRUD, locking, tasks, stale cleanup.
 
-All tests use real file I/O via tmp_path fixtures. Module-level paths
-are monkeypatched so tests never touch the real dashboard data.
+All tests use real file I/O in a temp store directory that is emptied before
+each test (see conftest). Module-level paths are monkeypatched once per run so
+tests never touch the real dashboard data.
 """
 
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
+import shutil
 import threading
-import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import pytest
 
 from lib import store
-from lib.models import SessionStatus
+from lib.models import Session, SessionStatus
+from tests.conftest import _restore, _snapshot
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -22,21 +29,46 @@ from lib.models import SessionStatus
 
 
 @pytest.fixture(autouse=True)
-def _isolate_store(tmp_path, monkeypatch):
-    """Redirect all store paths to a temp directory."""
-    monkeypatch.setattr(store, "DASHBOARD_DIR", tmp_path)
-    monkeypatch.setattr(store, "SESSIONS_DIR", tmp_path / "sessions")
-    monkeypatch.setattr(store, "ARCHIVE_DIR", tmp_path / "sessions" / "archive")
-    monkeypatch.setattr(store, "PROJECTS_DIR", tmp_path / "projects")
-    monkeypatch.setattr(store, "CONFIG_PATH", tmp_path / "config.json")
-    store._ensure_dirs()
+def _isolate_store(store_root):
+    """Start every test on an empty store (shared temp dir, see conftest)."""
+    return store_root
+
+
+@pytest.fixture(scope="module")
+def _populated_snapshot(_store_root) -> tuple[dict, dict[Path, bytes]]:
+    """One active, one completed and one parked session in projects "a" and "b"."""
+    shutil.rmtree(_store_root)
+    _store_root.mkdir()
+    ids = {}
+    for slug in ("a", "b"):
+        for status in SessionStatus:
+            sid = store.create_session(project_slug=slug, intent=f"{slug} {status}").session_id
+            if status is SessionStatus.COMPLETED:
+                store.complete_session(sid, outcome="Done")
+            elif status is SessionStatus.PARKED:
+                store.park_session(sid, reason="Break")
+            ids[slug, status] = sid
+    return ids, _snapshot(_store_root)
 
 
 @pytest.fixture
-def session_id():
-    """Create a session and return its ID."""
-    s = store.create_session(project_slug="test-project", intent="Test session")
-    return s.session_id
+def populated_store(_populated_snapshot, store_root) -> dict[tuple[str, SessionStatus], str]:
+    """Restore the query corpus; returns {(project_slug, status): session_id}."""
+    ids, files = _populated_snapshot
+    _restore(store_root, files)
+    return ids
+
+
+def _add_events_worker(root: str, session_id: str, worker: int, count: int) -> None:
+    """Child-process body: point the store at root and append count events."""
+    root_path = Path(root)
+    store.DASHBOARD_DIR = root_path
+    store.SESSIONS_DIR = root_path / "sessions"
+    store.ARCHIVE_DIR = root_path / "sessions" / "archive"
+    store.PROJECTS_DIR = root_path / "projects"
+    store.CONFIG_PATH = root_path / "config.json"
+    for i in range(count):
+        store.add_event(session_id, f"Process {worker} event {i}")
 
 
 # ---------------------------------------------------------------------------
@@ -45,15 +77,15 @@ def session_id():
 
 
 class TestConfig:
-    def test_load_creates_default(self, tmp_path):
+    def test_load_creates_default(self):
         config = store.load_config()
         assert config.version == 1
         assert config.projects == {}
-        assert (tmp_path / "config.json").exists()
+        assert store.CONFIG_PATH.exists()
 
     def test_save_and_load_roundtrip(self):
         config = store.load_config()
-        config.settings.dashboard_port = 8080
+        config.settings = replace(config.settings, dashboard_port=8080)
         store.save_config(config)
 
         reloaded = store.load_config()
@@ -89,6 +121,7 @@ class TestRegisterProject:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("store_dirs")
 class TestSchemaVersioning:
     def test_new_session_has_schema_version(self):
         s = store.create_session(project_slug="proj", intent="Test")
@@ -109,14 +142,22 @@ class TestSchemaVersioning:
             "started_at": "2026-01-01T00:00:00+00:00",
             "last_heartbeat": "2026-01-01T00:00:00+00:00",
         }
-        with open(path, "w") as f:
-            json.dump(v1_data, f)
+        path.write_bytes(json.dumps(v1_data).encode())
 
         s = store.get_session(sid)
         assert s is not None
         assert s.intent == "Legacy session"
         assert s.tasks == []  # v1 → v2 migration adds tasks
 
+    def test_reads_compact_utf8_bytes(self):
+        """Compact, non-ASCII-escaped UTF-8 (orjson's output shape) reads the same."""
+        s = store.create_session(project_slug="proj", intent="Café — ünïcode")
+        path = store.SESSIONS_DIR / f"{s.session_id}.json"
+        data = json.loads(path.read_bytes())
+        path.write_bytes(json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode())
+
+        assert store.get_session(s.session_id) == s
+
     def test_v2_session_not_modified(self):
         """A v2 session passes through migration unchanged."""
         s = store.create_session(project_slug="proj", intent="Modern")
@@ -137,8 +178,7 @@ class TestSchemaVersioning:
             "tasks": [],
             "schema_version": 2,
         }
-        with open(path, "w") as f:
-            json.dump(v2_data, f)
+        path.write_bytes(json.dumps(v2_data).encode())
 
         s = store.get_session(sid)
         assert s is not None
@@ -271,6 +311,19 @@ class TestAppendOperations:
     def test_add_event_not_found(self):
         assert store.add_event("sess_20000101T0000_0000", "msg") is None
 
+    def test_add_events_batch_is_single_write(self, session_id, monkeypatch):
+        saves = []
+        original = store._save_session
+        monkeypatch.setattr(store, "_save_session", lambda s: (saves.append(s), original(s)))
+        s = store.add_events(session_id, ["A", "B", "C"])
+        assert [e["message"] for e in s.events] == ["A", "B", "C"]
+        assert len(saves) == 1
+
+    def test_add_events_invalid_message_rejects_batch(self, session_id):
+        with pytest.raises(ValueError):
+            store.add_events(session_id, ["ok", "x" * (store.MAX_MESSAGE + 1)])
+        assert store.get_session(session_id).events == []
+
     def test_add_commit(self, session_id):
         s = store.add_commit(session_id, "abc1234567890", "Initial commit")
         assert len(s.commits) == 1
@@ -281,6 +334,20 @@ class TestAppendOperations:
         s = store.add_commit(session_id, "abc1234999999", "Second with same prefix")
         assert len(s.commits) == 1  # same SHA[:7]
 
+    def test_add_commits_batch(self, session_id):
+        store.add_commit(session_id, "abc1234567890", "Existing")
+        s = store.add_commits(session_id, [
+            ("abc1234999999", "Same prefix as existing"),
+            ("def4567890123", "Second"),
+            ("def4567aaaaaa", "Same prefix within batch"),
+        ])
+        assert [c["sha"] for c in s.commits] == ["abc1234567890", "def4567890123"]
+
+    def test_add_commits_rejects_whole_batch_on_invalid_sha(self, session_id):
+        with pytest.raises(ValueError, match="Invalid commit SHA"):
+            store.add_commits(session_id, [("abc1234", "ok"), ("not-hex", "bad")])
+        assert store.get_session(session_id).commits == []
+
     def test_add_decision(self, session_id):
         s = store.add_decision(session_id, "Use JSON storage")
         assert "Use JSON storage" in s.decisions
@@ -317,6 +384,18 @@ class TestTaskOperations:
         subjects = {t["subject"] for t in s.tasks}
         assert subjects == {"Task A", "Task B", "Task C"}
 
+    def test_add_tasks_batch_is_single_write(self, session_id, monkeypatch):
+        saves = []
+        original = store._save_session
+        monkeypatch.setattr(store, "_save_session", lambda s: (saves.append(s), original(s)))
+        store.add_tasks(session_id, [f"Task {i}" for i in range(20)])
+        assert len(saves) == 1
+
+    def test_add_tasks_invalid_subject_rejects_batch(self, session_id):
+        with pytest.raises(ValueError, match="task subject"):
+            store.add_tasks(session_id, ["Valid", ""])
+        assert store.get_session(session_id).tasks == []
+
     def test_add_task_deduplicates(self, session_id):
         store.add_task(session_id, "Same task")
         s = store.add_task(session_id, "Same task")
@@ -354,6 +433,11 @@ class TestTaskOperations:
         with pytest.raises(ValueError, match="Invalid status"):
             store.update_task(session_id, task_id, "invalid_status")
 
+    def test_update_task_invalid_status_rejected_before_read(self, session_id, monkeypatch):
+        monkeypatch.setattr(store, "get_session", lambda sid: pytest.fail("session was read"))
+        with pytest.raises(ValueError, match="Must be one of: completed, in_progress, pending"):
+            store.update_task(session_id, "t0000", "done")
+
     def test_update_task_not_found_task_id(self, session_id):
         store.add_task(session_id, "Task")
         with pytest.raises(ValueError, match="not found"):
@@ -401,12 +485,27 @@ class TestTaskOperations:
 # ---------------------------------------------------------------------------
 
 
+class TestNowIso:
+    def test_fixed_width_utc_and_current(self):
+        before = datetime.now(UTC)
+        stamp = store._now_iso()
+        after = datetime.now(UTC)
+        assert len(stamp) == len("2026-01-01T00:00:00.000000+00:00")
+        assert before <= datetime.fromisoformat(stamp) <= after
+
+    def test_create_session_uses_one_timestamp(self):
+        s = store.create_session(project_slug="test", intent="One clock read")
+        assert s.started_at == s.last_heartbeat
+
+
 class TestHeartbeat:
-    def test_heartbeat_updates_timestamp(self, session_id):
+    def test_heartbeat_updates_timestamp(self, session_id, monkeypatch):
         before = store.get_session(session_id).last_heartbeat
-        time.sleep(0.01)
+        later = (datetime.fromisoformat(before) + timedelta(seconds=1)).isoformat()
+        monkeypatch.setattr(store, "_now_iso", lambda: later)
         s = store.heartbeat(session_id)
-        assert s.last_heartbeat > before
+        assert s.last_heartbeat == later
+        assert store.get_session(session_id).last_heartbeat == later
 
     def test_heartbeat_only_active_sessions(self, session_id):
         store.complete_session(session_id, outcome="Done")
@@ -435,38 +534,42 @@ class TestQueries:
         sessions = store.list_sessions()
         assert sessions == []
 
-    def test_list_sessions_all(self):
-        store.create_session(project_slug="a", intent="A")
-        store.create_session(project_slug="b", intent="B")
-        assert len(store.list_sessions()) == 2
-
-    def test_list_sessions_filter_project(self):
-        store.create_session(project_slug="a", intent="A")
-        store.create_session(project_slug="b", intent="B")
-        assert len(store.list_sessions(project_slug="a")) == 1
+    def test_list_sessions_all(self, populated_store):
+        assert {s.session_id for s in store.list_sessions()} == set(populated_store.values())
 
-    def test_list_sessions_filter_status(self, session_id):
-        store.complete_session(session_id, outcome="Done")
-        store.create_session(project_slug="test-project", intent="New")
+    def test_list_sessions_filter_project(self, populated_store):
+        sessions = store.list_sessions(project_slug="a")
+        assert {s.session_id for s in sessions} == {
+            sid for (slug, _), sid in populated_store.items() if slug == "a"
+        }
 
+    def test_list_sessions_filter_status(self, populated_store):
         active = store.list_sessions(status=SessionStatus.ACTIVE)
         completed = store.list_sessions(status=SessionStatus.COMPLETED)
-        assert len(active) == 1
-        assert len(completed) == 1
+        assert {s.project_slug for s in active} == {"a", "b"}
+        assert all(s.status == SessionStatus.ACTIVE for s in active)
+        assert len(completed) == 2
 
-    def test_get_active_sessions(self):
-        store.create_session(project_slug="p", intent="Active")
-        s2 = store.create_session(project_slug="p", intent="To complete")
-        store.complete_session(s2.session_id, outcome="Done")
+    def test_list_sessions_filter_project_and_status(self, populated_store):
+        sessions = store.list_sessions(project_slug="b", status=SessionStatus.COMPLETED)
+        assert [s.session_id for s in sessions] == [populated_store["b", SessionStatus.COMPLETED]]
 
-        active = store.get_active_sessions("p")
-        assert len(active) == 1
-        assert active[0].intent == "Active"
+    def test_get_active_sessions(self, populated_store):
+        active = store.get_active_sessions("a")
+        assert [s.session_id for s in active] == [populated_store["a", SessionStatus.ACTIVE]]
+        assert active[0].intent == "a active"
 
-    def test_get_parked_sessions(self, session_id):
-        store.park_session(session_id, reason="Break")
-        parked = store.get_parked_sessions("test-project")
-        assert len(parked) == 1
+    def test_get_parked_sessions(self, populated_store):
+        parked = store.get_parked_sessions("b")
+        assert [s.session_id for s in parked] == [populated_store["b", SessionStatus.PARKED]]
+
+    def test_complete_moves_session_between_status_queries(self, session_id):
+        """Production path: the status filters follow a real complete_session."""
+        store.complete_session(session_id, outcome="Done")
+        store.create_session(project_slug="test-project", intent="New")
+
+        assert len(store.list_sessions(status=SessionStatus.ACTIVE)) == 1
+        assert len(store.list_sessions(status=SessionStatus.COMPLETED)) == 1
 
 
 # ---------------------------------------------------------------------------
@@ -479,13 +582,7 @@ class TestStaleDetection:
         """Create a session with an old heartbeat."""
         s = store.create_session(project_slug="test", intent="Stale session")
         old_time = (datetime.now(UTC) - timedelta(hours=hours_ago)).isoformat()
-        # Directly update the file to set old heartbeat
-        path = store.SESSIONS_DIR / f"{s.session_id}.json"
-        with open(path) as f:
-            data = json.load(f)
-        data["last_heartbeat"] = old_time
-        with open(path, "w") as f:
-            json.dump(data, f)
+        store.update_session(s.session_id, last_heartbeat=old_time)
         return s.session_id
 
     def test_get_stale_sessions(self):
@@ -500,6 +597,55 @@ class TestStaleDetection:
         stale = store.get_stale_sessions(threshold_hours=24)
         assert len(stale) == 0
 
+    def test_only_stale_candidates_read_from_disk(self, monkeypatch):
+        sid = self._make_stale_session(hours_ago=48)
+        store.create_session(project_slug="test", intent="Fresh 1")
+        store.create_session(project_slug="test", intent="Fresh 2")
+        loaded = []
+        original = store.get_session
+        monkeypatch.setattr(store, "get_session", lambda s: (loaded.append(s), original(s))[1])
+
+        stale = store.get_stale_sessions(threshold_hours=24)
+        assert [s.session_id for s in stale] == [sid]
+        assert loaded == [sid]
+
+    def test_stale_scan_reads_only_candidates_at_scale(self, monkeypatch):
+        """1,000 fresh sessions: the scan stays index-only and reads just the stale ones."""
+        now = datetime.now(UTC)
+        old = (now - timedelta(hours=48)).isoformat()
+        store.SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+        index, stale_ids = {}, set()
+        for i in range(1010):
+            sid = f"sess_20260101T0000_{i:04x}"
+            session = Session(
+                session_id=sid, project_slug="test", status=SessionStatus.ACTIVE,
+                intent=f"S{i}", started_at=old,
+                last_heartbeat=old if i < 10 else now.isoformat(),
+            )
+            data = session.to_dict() | {"schema_version": store.SCHEMA_VERSION}
+            (store.SESSIONS_DIR / f"{sid}.json").write_bytes(json.dumps(data).encode())
+            index[sid] = store._index_entry(session)
+            if i < 10:
+                stale_ids.add(sid)
+        store._index_path().write_bytes(json.dumps(index).encode())
+        loaded = []
+        original = store.get_session
+        monkeypatch.setattr(store, "get_session", lambda s: (loaded.append(s), original(s))[1])
+
+        stale = store.get_stale_sessions(threshold_hours=24)
+        assert {s.session_id for s in stale} == stale_ids
+        assert sorted(loaded) == sorted(stale_ids)
+
+    def test_stale_index_entry_checked_against_file(self):
+        """An index that lags behind the file (e.g. crash mid-save) is not trusted."""
+        sid = self._make_stale_session(hours_ago=48)
+        path = store.SESSIONS_DIR / f"{sid}.json"
+        data = json.loads(path.read_bytes())
+        data["last_heartbeat"] = datetime.now(UTC).isoformat()
+        path.write_bytes(json.dumps(data).encode())
+
+        assert store.get_stale_sessions(threshold_hours=24) == []
+
     def test_cleanup_stale_sessions(self):
         store.register_project("Test", "/tmp/test")
         sid = self._make_stale_session(hours_ago=48)
@@ -525,6 +671,7 @@ class TestStaleDetection:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("store_dirs")
 class TestOrphanedLockCleanup:
     def test_cleanup_removes_orphaned_locks(self):
         """Lock files without matching session JSON are removed."""
@@ -545,6 +692,14 @@ class TestOrphanedLockCleanup:
         assert len(removed) == 0
         assert lock.exists()
 
+    def test_cleanup_mixed_directory(self):
+        s = store.create_session(project_slug="test", intent="Active")
+        for name in (f"{s.session_id}.lock", "sess_b_0000.lock", "sess_a_0000.lock"):
+            (store.SESSIONS_DIR / name).touch()
+
+        assert store.cleanup_orphaned_locks() == ["sess_a_0000.lock", "sess_b_0000.lock"]
+        assert (store.SESSIONS_DIR / f"{s.session_id}.lock").exists()
+
     def test_cleanup_stale_also_cleans_locks(self):
         """cleanup_stale_sessions() calls lock cleanup automatically."""
         orphan = store.SESSIONS_DIR / "sess_old_0000.lock"
@@ -623,12 +778,9 @@ class TestArchiving:
 
         # Backdate the ended_at to 60 days ago
         path = store.SESSIONS_DIR / f"{s.session_id}.json"
-        with open(path) as f:
-            data = json.load(f)
-        old_date = (datetime.now(UTC) - timedelta(days=60)).isoformat()
-        data["ended_at"] = old_date
-        with open(path, "w") as f:
-            json.dump(data, f)
+        data = json.loads(path.read_bytes())
+        data["ended_at"] = (datetime.now(UTC) - timedelta(days=60)).isoformat()
+        path.write_bytes(json.dumps(data).encode())
 
         archived = store.archive_old_sessions(days=30)
         assert s.session_id in archived
@@ -649,11 +801,9 @@ class TestArchiving:
 
         # Backdate the heartbeat
         path = store.SESSIONS_DIR / f"{s.session_id}.json"
-        with open(path) as f:
-            data = json.load(f)
+        data = json.loads(path.read_bytes())
         data["ended_at"] = (datetime.now(UTC) - timedelta(days=60)).isoformat()
-        with open(path, "w") as f:
-            json.dump(data, f)
+        path.write_bytes(json.dumps(data).encode())
 
         archived = store.archive_old_sessions(days=30)
         assert len(archived) == 0
@@ -724,9 +874,10 @@ class TestProjectState:
 
 
 class TestAtomicWrite:
-    def test_atomic_write_creates_file(self, tmp_path):
+    @pytest.mark.parametrize("durable", [False, True])
+    def test_atomic_write_creates_file(self, tmp_path, durable):
         path = tmp_path / "test.json"
-        store._atomic_write(path, {"key": "value"})
+        store._atomic_write(path, {"key": "value"}, durable=durable)
         assert path.exists()
         with open(path) as f:
             assert json.load(f) == {"key": "value"}
@@ -735,8 +886,15 @@ class TestAtomicWrite:
         path = tmp_path / "test.json"
         store._atomic_write(path, {"ok": True})
         # No .tmp files should remain
-        tmp_files = list(tmp_path.glob("*.tmp"))
-        assert len(tmp_files) == 0
+        with os.scandir(tmp_path) as entries:
+            assert not any(e.name.endswith(".tmp") for e in entries)
+
+    @pytest.mark.parametrize(("durable", "expected_fsyncs"), [(False, 0), (True, 2)])
+    def test_fsync_only_when_durable(self, tmp_path, monkeypatch, durable, expected_fsyncs):
+        calls = []
+        monkeypatch.setattr(store.os, "fsync", calls.append)
+        store._atomic_write(tmp_path / "test.json", {"ok": True}, durable=durable)
+        assert len(calls) == expected_fsyncs  # file + directory
 
     def test_atomic_write_overwrites(self, tmp_path):
         path = tmp_path / "test.json"
@@ -751,41 +909,35 @@ class TestAtomicWrite:
 # ---------------------------------------------------------------------------
 
 
-class TestConcurrentWrites:
-    def test_concurrent_events_no_data_loss(self, session_id):
-        """Multiple threads adding events should not lose any."""
-        n_threads = 5
-        events_per_thread = 4
-        barrier = threading.Barrier(n_threads)
+_WRITES_PER_THREAD = 4
 
-        def add_events(thread_num):
-            barrier.wait()
-            for i in range(events_per_thread):
-                store.add_event(session_id, f"Thread {thread_num} event {i}")
 
-        threads = [
-            threading.Thread(target=add_events, args=(t,))
-            for t in range(n_threads)
-        ]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+def _concurrent_write(op: str, session_id: str, thread_num: int) -> None:
+    """One thread's share of writes for a TestConcurrentWrites op."""
+    messages = [f"Thread {thread_num} entry {i}" for i in range(_WRITES_PER_THREAD)]
+    if op == "event_batch":
+        store.add_events(session_id, messages)
+        return
+    add = store.add_event if op == "event" else store.add_task
+    for message in messages:
+        add(session_id, message)
 
-        s = store.get_session(session_id)
-        assert len(s.events) == n_threads * events_per_thread
 
-    def test_concurrent_tasks_no_data_loss(self, session_id):
-        """Multiple threads adding tasks should not lose any."""
+class TestConcurrentWrites:
+    @pytest.mark.parametrize(
+        ("op", "attr"), [("event", "events"), ("event_batch", "events"), ("task", "tasks")],
+    )
+    def test_concurrent_writes_no_data_loss(self, session_id, op, attr):
+        """Threads writing to one session at once should not lose any entries."""
         n_threads = 5
         barrier = threading.Barrier(n_threads)
 
-        def add_task(thread_num):
+        def worker(thread_num):
             barrier.wait()
-            store.add_task(session_id, f"Task from thread {thread_num}")
+            _concurrent_write(op, session_id, thread_num)
 
         threads = [
-            threading.Thread(target=add_task, args=(t,))
+            threading.Thread(target=worker, args=(t,))
             for t in range(n_threads)
         ]
         for t in threads:
@@ -794,7 +946,24 @@ class TestConcurrentWrites:
             t.join()
 
         s = store.get_session(session_id)
-        assert len(s.tasks) == n_threads
+        assert len(getattr(s, attr)) == n_threads * _WRITES_PER_THREAD
+
+    @pytest.mark.slow
+    def test_cross_process_events_no_data_loss(self, session_id, store_root):
+        """Separate processes contend on the real flock; no event may be lost."""
+        n_procs = 4
+        events_per_proc = 5
+        ctx = multiprocessing.get_context("spawn")  # no fork of a threaded pytest worker
+        with ProcessPoolExecutor(max_workers=n_procs, mp_context=ctx) as pool:
+            futures = [
+                pool.submit(_add_events_worker, str(store_root), session_id, w, events_per_proc)
+                for w in range(n_procs)
+            ]
+            for future in futures:
+                future.result()
+
+        s = store.get_session(session_id)
+        assert len(s.events) == n_procs * events_per_proc
 
 
 # ---------------------------------------------------------------------------
@@ -820,6 +989,51 @@ class TestBuildOverview:
         assert len(proj["active_sessions"]) == 1
         assert "task_summary" in proj["active_sessions"][0]
 
+    def test_build_overview_does_not_rescan_completed_sessions(self, monkeypatch):
+        """Only the five newest completed sessions are read, not the whole history."""
+        store.register_project("P", "/tmp/p")
+        completed = []
+        for i in range(8):
+            s = store.create_session(project_slug="p", intent=f"Done {i}")
+            store.complete_session(s.session_id, outcome="ok")
+            completed.append(s.session_id)
+        active = store.create_session(project_slug="p", intent="Work").session_id
+        loaded = []
+        original = store.get_session
+        monkeypatch.setattr(store, "get_session", lambda s: (loaded.append(s), original(s))[1])
+
+        proj = store.build_overview()["projects"][0]
+
+        newest = completed[:2:-1]
+        assert [s["session_id"] for s in proj["completed_sessions"]] == newest
+        assert sorted(loaded) == sorted([active, *newest])  # each read exactly once
+
+    def test_list_sessions_limit_returns_newest(self):
+        ids = [store.create_session(project_slug="p", intent=f"S{i}").session_id for i in range(4)]
+        assert [s.session_id for s in store.list_sessions(limit=2)] == ids[:1:-1]
+        assert [s.session_id for s in store.list_sessions(limit=2, full_load=False)] == ids[:1:-1]
+
+    def test_list_sessions_limit_stops_archive_scan(self, monkeypatch):
+        store.ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+        for minute in range(5):
+            sid = f"sess_20260101T000{minute}_abcd"
+            session = Session(
+                session_id=sid, project_slug="p", status=SessionStatus.COMPLETED,
+                intent=f"S{minute}", started_at=f"2026-01-01T00:0{minute}:00+00:00",
+            )
+            data = session.to_dict() | {"schema_version": store.SCHEMA_VERSION}
+            (store.ARCHIVE_DIR / f"{sid}.json").write_bytes(json.dumps(data).encode())
+        read = []
+        original = store._safe_read_json
+        monkeypatch.setattr(
+            store, "_safe_read_json", lambda p: (read.append(p.name), original(p))[1],
+        )
+
+        sessions = store.list_sessions(include_archived=True, limit=2)
+        assert [s.intent for s in sessions] == ["S4", "S3"]
+        assert [name for name in read if name.startswith("sess_")] == [
+            "sess_20260101T0004_abcd.json", "sess_20260101T0003_abcd.json",
+        ]
 
 # ---------------------------------------------------------------------------
 # Security hardening (C5)
@@ -858,6 +1072,7 @@ class TestSafeReadJson:
         assert store._safe_read_json(good) == {"hello": "world"}
 
 
+@pytest.mark.usefixtures("store_dirs")
 class TestCorruptFileSkipping:
     """list_sessions and archive_old_sessions skip corrupt files."""
 
@@ -975,6 +1190,13 @@ class TestSessionIndex:
         assert len(sessions) == 1
         assert sessions[0].session_id == s.session_id
 
+    def test_empty_index_not_rebuilt_on_read(self):
+        store.list_sessions()  # writes the empty index
+        before = os.stat(store._index_path()).st_ino
+
+        store.list_sessions()
+        assert os.stat(store._index_path()).st_ino == before
+
     def test_index_not_affected_by_archived_sessions(self):
         s = store.create_session(project_slug="test", intent="Archive test")
         store.complete_session(s.session_id, outcome="Done")
@@ -1002,6 +1224,53 @@ class TestSessionIndex:
         assert s2.session_id not in ids
 
 
+class TestSessionCache:
+    def test_returned_sessions_are_independent(self, session_id):
+        store.add_task(session_id, "Task")
+        first = store.get_session(session_id)
+        first.tasks[0]["status"] = "completed"
+        first.events.append({"message": "local only"})
+
+        again = store.get_session(session_id)
+        assert again.tasks[0]["status"] == "pending"
+        assert again.events == []
+
+    def test_external_rewrite_is_picked_up(self, session_id):
+        store.get_session(session_id)  # populate the cache
+        path = store.SESSIONS_DIR / f"{session_id}.json"
+        data = json.loads(path.read_bytes())
+        data["intent"] = "Changed elsewhere"
+        store._atomic_write(path, data)
+
+        assert store.get_session(session_id).intent == "Changed elsewhere"
+
+    def test_reads_under_session_lock_bypass_cache(self, session_id, monkeypatch):
+        monkeypatch.setattr(store, "_read_session_cached", lambda p: pytest.fail("cache used"))
+        with store._session_lock(session_id):
+            assert store.get_session(session_id).session_id == session_id
+
+    def test_cache_evicts_oldest_past_max(self, monkeypatch):
+        monkeypatch.setattr(store, "_SESSION_CACHE_MAX", 2)
+        ids = [store.create_session(project_slug="p", intent=f"S{i}").session_id for i in range(3)]
+        store._SESSION_CACHE.clear()
+        for sid in ids:
+            assert store.get_session(sid).session_id == sid
+
+        cached = {p.stem for p in store._SESSION_CACHE}
+        assert cached == set(ids[1:])
+
+    def test_concurrent_reads_past_max(self, monkeypatch):
+        monkeypatch.setattr(store, "_SESSION_CACHE_MAX", 4)
+        ids = [store.create_session(project_slug="p", intent=f"S{i}").session_id for i in range(16)]
+        store._SESSION_CACHE.clear()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(store.get_session, ids * 20))
+
+        assert [s.session_id for s in results] == ids * 20
+        assert len(store._SESSION_CACHE) <= 4
+
+
 class TestRegisterLaunch:
     """Launch-onafhankelijke, idempotente registratie (PLAN-2026-032 keystone)."""
 
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
+from lib import store
 from lib.validation import (
+    MAX_COMMITS,
     MAX_DECISION,
     MAX_INTENT,
     MAX_MESSAGE,
     MAX_PROJECT_NAME,
     MAX_TASK_SUBJECT,
+    parse_commits_json,
     validate_commits_json,
     validate_git_branch,
     validate_optional_string,
@@ -80,6 +85,10 @@ class TestValidateProjectSlug:
         with pytest.raises(ValueError, match="cannot be empty"):
             validate_project_slug("")
 
+    def test_none_rejected(self):
+        with pytest.raises(ValueError, match="cannot be empty"):
+            validate_project_slug(None)
+
     def test_uppercase_rejected(self):
         with pytest.raises(ValueError, match="Invalid project slug"):
             validate_project_slug("MyProject")
@@ -100,6 +109,10 @@ class TestValidateProjectSlug:
         with pytest.raises(ValueError, match="Invalid project slug"):
             validate_project_slug("../etc")
 
+    def test_trailing_newline_rejected(self):
+        with pytest.raises(ValueError, match="Invalid project slug"):
+            validate_project_slug("my-project\n")
+
 
 # ---------------------------------------------------------------------------
 # validate_sha
@@ -132,6 +145,15 @@ class TestValidateSha:
     def test_min_length_accepted(self):
         assert validate_sha("abcd") == "abcd"
 
+    def test_trailing_newline_rejected(self):
+        with pytest.raises(ValueError, match="Invalid commit SHA"):
+            validate_sha("abcd1234\n")
+
+    def test_cached_rejection_still_raises(self):
+        for _ in range(2):
+            with pytest.raises(ValueError, match="'nothex!'"):
+                validate_sha("nothex!")
+
 
 # ---------------------------------------------------------------------------
 # validate_git_branch
@@ -152,6 +174,10 @@ class TestValidateGitBranch:
         with pytest.raises(ValueError, match="cannot be empty"):
             validate_git_branch("")
 
+    def test_none_rejected(self):
+        with pytest.raises(ValueError, match="cannot be empty"):
+            validate_git_branch(None)
+
     def test_starting_with_dot_rejected(self):
         with pytest.raises(ValueError, match="Invalid git branch"):
             validate_git_branch(".hidden")
@@ -164,6 +190,10 @@ class TestValidateGitBranch:
         with pytest.raises(ValueError, match="Invalid git branch"):
             validate_git_branch("-branch")
 
+    def test_trailing_newline_rejected(self):
+        with pytest.raises(ValueError, match="Invalid git branch"):
+            validate_git_branch("main\n")
+
 
 # ---------------------------------------------------------------------------
 # validate_positive_int
@@ -250,168 +280,144 @@ class TestValidateCommitsJson:
 
 
 # ---------------------------------------------------------------------------
-# Store-level integration: validation enforced by store functions
+# parse_commits_json
 # ---------------------------------------------------------------------------
 
 
-class TestStoreValidation:
-    """Test that store functions enforce validation via ValueError."""
-
-    @pytest.fixture(autouse=True)
-    def _isolate_store(self, tmp_path, monkeypatch):
-        monkeypatch.setattr("lib.store.DASHBOARD_DIR", tmp_path)
-        monkeypatch.setattr("lib.store.SESSIONS_DIR", tmp_path / "sessions")
-        monkeypatch.setattr("lib.store.ARCHIVE_DIR", tmp_path / "sessions" / "archive")
-        monkeypatch.setattr("lib.store.PROJECTS_DIR", tmp_path / "projects")
-        monkeypatch.setattr("lib.store.CONFIG_PATH", tmp_path / "config.json")
-
-    def test_create_session_empty_intent_rejected(self):
-        from lib import store
-
-        with pytest.raises(ValueError, match="cannot be empty"):
-            store.create_session("test-project", "")
-
-    def test_create_session_intent_too_long_rejected(self):
-        from lib import store
-
-        with pytest.raises(ValueError, match="too long"):
-            store.create_session("test-project", "x" * (MAX_INTENT + 1))
-
-    def test_create_session_invalid_slug_rejected(self):
-        from lib import store
-
-        with pytest.raises(ValueError, match="Invalid project slug"):
-            store.create_session("../escape", "valid intent")
-
-    def test_create_session_invalid_branch_rejected(self):
-        from lib import store
-
-        with pytest.raises(ValueError, match="Invalid git branch"):
-            store.create_session("test-project", "valid intent", git_branch=".bad")
-
-    def test_create_session_valid(self):
-        from lib import store
-
-        session = store.create_session("test-project", "Build feature X")
-        assert session.intent == "Build feature X"
-        assert session.project_slug == "test-project"
-
-    def test_add_event_empty_message_rejected(self):
-        from lib import store
-
-        session = store.create_session("test-project", "intent")
-        with pytest.raises(ValueError, match="cannot be empty"):
-            store.add_event(session.session_id, "")
-
-    def test_add_event_message_too_long_rejected(self):
-        from lib import store
-
-        session = store.create_session("test-project", "intent")
-        with pytest.raises(ValueError, match="too long"):
-            store.add_event(session.session_id, "x" * (MAX_MESSAGE + 1))
-
-    def test_add_commit_invalid_sha_rejected(self):
-        from lib import store
-
-        session = store.create_session("test-project", "intent")
-        with pytest.raises(ValueError, match="Invalid commit SHA"):
-            store.add_commit(session.session_id, "not-hex", "message")
-
-    def test_add_commit_valid(self):
-        from lib import store
-
-        session = store.create_session("test-project", "intent")
-        result = store.add_commit(session.session_id, "abcdef1", "fix bug")
-        assert len(result.commits) == 1
-
-    def test_add_decision_empty_rejected(self):
-        from lib import store
-
-        session = store.create_session("test-project", "intent")
-        with pytest.raises(ValueError, match="cannot be empty"):
-            store.add_decision(session.session_id, "")
-
-    def test_add_decision_too_long_rejected(self):
-        from lib import store
-
-        session = store.create_session("test-project", "intent")
-        with pytest.raises(ValueError, match="too long"):
-            store.add_decision(session.session_id, "x" * (MAX_DECISION + 1))
-
-    def test_complete_session_empty_outcome_rejected(self):
-        from lib import store
-
-        session = store.create_session("test-project", "intent")
-        with pytest.raises(ValueError, match="cannot be empty"):
-            store.complete_session(session.session_id, "")
+class TestParseCommitsJson:
+    def test_valid_commits(self):
+        raw = ' [ {"sha": "abcd1234", "message": "fix"} , {"sha": "beef", "message": "x"} ] '
+        assert parse_commits_json(raw) == [
+            {"sha": "abcd1234", "message": "fix"},
+            {"sha": "beef", "message": "x"},
+        ]
 
-    def test_complete_session_invalid_commits_rejected(self):
-        from lib import store
+    def test_empty_array(self):
+        assert parse_commits_json("[]") == []
 
-        session = store.create_session("test-project", "intent")
+    def test_not_an_array_rejected(self):
         with pytest.raises(ValueError, match="must be a JSON array"):
-            store.complete_session(session.session_id, "done", commits="bad")
+            parse_commits_json('{"sha": "abcd"}')
 
-    def test_park_session_empty_reason_rejected(self):
-        from lib import store
+    def test_malformed_json_raises_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            parse_commits_json('[{"sha": "abcd", "message": "x"},]')
 
-        session = store.create_session("test-project", "intent")
-        with pytest.raises(ValueError, match="cannot be empty"):
-            store.park_session(session.session_id, "")
+    def test_trailing_data_rejected(self):
+        with pytest.raises(json.JSONDecodeError, match="Extra data"):
+            parse_commits_json('[] []')
 
-    def test_request_action_empty_reason_rejected(self):
-        from lib import store
-
-        session = store.create_session("test-project", "intent")
-        with pytest.raises(ValueError, match="cannot be empty"):
-            store.request_action(session.session_id, "")
-
-    def test_add_task_subject_too_long_rejected(self):
-        from lib import store
+    def test_stops_at_first_invalid_entry(self):
+        # The trailing garbage is never decoded: the invalid SHA is hit first.
+        with pytest.raises(ValueError, match="Invalid commit SHA"):
+            parse_commits_json('[{"sha": "xyz", "message": "x"}, !!!')
 
-        session = store.create_session("test-project", "intent")
-        with pytest.raises(ValueError, match="too long"):
-            store.add_task(session.session_id, "x" * (MAX_TASK_SUBJECT + 1))
+    def test_too_many_rejected_early(self):
+        entry = '{"sha": "abcd", "message": "x"}'
+        raw = "[" + ",".join([entry] * MAX_COMMITS) + ", !!!"
+        with pytest.raises(ValueError, match="Too many commits"):
+            parse_commits_json(raw)
 
-    def test_archive_old_sessions_negative_days_rejected(self):
-        from lib import store
 
-        with pytest.raises(ValueError, match="must be positive"):
-            store.archive_old_sessions(days=0)
+# ---------------------------------------------------------------------------
+# Store-level integration: validation enforced by store functions
+# ---------------------------------------------------------------------------
 
-    def test_archive_old_sessions_excessive_days_rejected(self):
-        from lib import store
 
-        with pytest.raises(ValueError, match="too large"):
-            store.archive_old_sessions(days=5000)
+# Rejections that need no session: (call, expected error)
+_REJECTED_WITHOUT_SESSION = {
+    "create_session_empty_intent": (
+        lambda: store.create_session("test-project", ""), "cannot be empty",
+    ),
+    "create_session_intent_too_long": (
+        lambda: store.create_session("test-project", "x" * (MAX_INTENT + 1)), "too long",
+    ),
+    "create_session_invalid_slug": (
+        lambda: store.create_session("../escape", "valid intent"), "Invalid project slug",
+    ),
+    "create_session_invalid_branch": (
+        lambda: store.create_session("test-project", "valid intent", git_branch=".bad"),
+        "Invalid git branch",
+    ),
+    "archive_old_sessions_negative_days": (
+        lambda: store.archive_old_sessions(days=0), "must be positive",
+    ),
+    "archive_old_sessions_excessive_days": (
+        lambda: store.archive_old_sessions(days=5000), "too large",
+    ),
+    "register_project_empty_name": (
+        lambda: store.register_project("", "/some/path"), "cannot be empty",
+    ),
+    "register_project_name_too_long": (
+        lambda: store.register_project("x" * (MAX_PROJECT_NAME + 1), "/some/path"), "too long",
+    ),
+}
+
+# Rejections on an existing session: (call taking the session ID, expected error)
+_REJECTED_ON_SESSION = {
+    "add_event_empty_message": (lambda sid: store.add_event(sid, ""), "cannot be empty"),
+    "add_event_message_too_long": (
+        lambda sid: store.add_event(sid, "x" * (MAX_MESSAGE + 1)), "too long",
+    ),
+    "add_commit_invalid_sha": (
+        lambda sid: store.add_commit(sid, "not-hex", "message"), "Invalid commit SHA",
+    ),
+    "add_decision_empty": (lambda sid: store.add_decision(sid, ""), "cannot be empty"),
+    "add_decision_too_long": (
+        lambda sid: store.add_decision(sid, "x" * (MAX_DECISION + 1)), "too long",
+    ),
+    "complete_session_empty_outcome": (
+        lambda sid: store.complete_session(sid, ""), "cannot be empty",
+    ),
+    "complete_session_invalid_commits": (
+        lambda sid: store.complete_session(sid, "done", commits="bad"), "must be a JSON array",
+    ),
+    "park_session_empty_reason": (lambda sid: store.park_session(sid, ""), "cannot be empty"),
+    "request_action_empty_reason": (
+        lambda sid: store.request_action(sid, ""), "cannot be empty",
+    ),
+    "add_task_subject_too_long": (
+        lambda sid: store.add_task(sid, "x" * (MAX_TASK_SUBJECT + 1)), "too long",
+    ),
+    "update_session_intent_too_long": (
+        lambda sid: store.update_session(sid, intent="x" * (MAX_INTENT + 1)), "too long",
+    ),
+}
 
-    def test_register_project_empty_name_rejected(self):
-        from lib import store
 
-        with pytest.raises(ValueError, match="cannot be empty"):
-            store.register_project("", "/some/path")
+class TestStoreValidation:
+    """Test that store functions enforce validation via ValueError."""
 
-    def test_register_project_name_too_long_rejected(self):
-        from lib import store
+    @pytest.fixture(autouse=True)
+    def _isolate_store(self, store_root):
+        return store_root
 
-        with pytest.raises(ValueError, match="too long"):
-            store.register_project("x" * (MAX_PROJECT_NAME + 1), "/some/path")
+    @pytest.mark.parametrize("case", list(_REJECTED_WITHOUT_SESSION))
+    def test_rejected(self, case):
+        call, match = _REJECTED_WITHOUT_SESSION[case]
+        with pytest.raises(ValueError, match=match):
+            call()
 
-    def test_update_session_intent_too_long_rejected(self):
-        from lib import store
+    @pytest.mark.parametrize("case", list(_REJECTED_ON_SESSION))
+    def test_rejected_on_session(self, session_id, case):
+        call, match = _REJECTED_ON_SESSION[case]
+        with pytest.raises(ValueError, match=match):
+            call(session_id)
 
-        session = store.create_session("test-project", "intent")
-        with pytest.raises(ValueError, match="too long"):
-            store.update_session(session.session_id, intent="x" * (MAX_INTENT + 1))
+    def test_create_session_valid(self):
+        session = store.create_session("test-project", "Build feature X")
+        assert session.intent == "Build feature X"
+        assert session.project_slug == "test-project"
 
-    def test_update_task_subject_too_long_rejected(self):
-        from lib import store
+    def test_add_commit_valid(self, session_id):
+        result = store.add_commit(session_id, "abcdef1", "fix bug")
+        assert len(result.commits) == 1
 
-        session = store.create_session("test-project", "intent")
-        session = store.add_task(session.session_id, "task 1")
+    def test_update_task_subject_too_long_rejected(self, session_id):
+        session = store.add_task(session_id, "task 1")
         task_id = session.tasks[0]["id"]
         with pytest.raises(ValueError, match="too long"):
             store.update_task(
-                session.session_id, task_id, "pending",
+                session_id, task_id, "pending",
                 subject="x" * (MAX_TASK_SUBJECT + 1),
             )
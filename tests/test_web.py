@@ -1,15 +1,25 @@
 """Tests for web/app.py — FastAPI routes via TestClient.
 
 Tests the HTTP layer: status codes, response structure, content types.
-Store is monkeypatched to use tmp_path for isolation.
+Store is monkeypatched to a shared temp dir, reset per test (see conftest).
 """
 
 from __future__ import annotations
 
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
 
-from lib import store
+import web.app as web_app
+from lib import export, store
 from web.app import app
 
 # ---------------------------------------------------------------------------
@@ -18,19 +28,35 @@ from web.app import app
 
 
 @pytest.fixture(autouse=True)
-def _isolate_store(tmp_path, monkeypatch):
-    """Redirect all store paths to a temp directory."""
-    monkeypatch.setattr(store, "DASHBOARD_DIR", tmp_path)
-    monkeypatch.setattr(store, "SESSIONS_DIR", tmp_path / "sessions")
-    monkeypatch.setattr(store, "ARCHIVE_DIR", tmp_path / "sessions" / "archive")
-    monkeypatch.setattr(store, "PROJECTS_DIR", tmp_path / "projects")
-    monkeypatch.setattr(store, "CONFIG_PATH", tmp_path / "config.json")
-    store._ensure_dirs()
+def _isolate_store(store_root):
+    """Start every test on an empty store (shared temp dir, see conftest) and empty app caches.
+
+    Reset in place like the store itself: no per-test monkeypatch undo stack.
+    """
+    web_app._overview_cache = None
+    web_app._EXPORT_CACHE.clear()
+    web_app._DETAIL_CACHE.clear()
+    return store_root
+
+
+def _age_store(root, seconds: float = 3600) -> None:
+    """Backdate every store file and directory, as if last written `seconds` ago."""
+    then = time.time() - seconds
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, (then, then))
 
 
-@pytest.fixture
+def _must_not_run(*args):
+    # An Exception (not pytest.fail) so the app turns it into a 500 instead of
+    # tearing down the shared client's event loop.
+    raise AssertionError("should have been answered without this call")
+
+
+@pytest.fixture(scope="module")
 def client():
-    return TestClient(app)
+    """One TestClient (transport + lifespan) for the module; the store is still reset per test."""
+    with TestClient(app) as c:
+        yield c
 
 
 # ---------------------------------------------------------------------------
@@ -48,6 +74,23 @@ class TestIndex:
         resp = client.get("/")
         assert "<html" in resp.text.lower() or "<!doctype" in resp.text.lower()
 
+    def test_index_sets_etag_and_revalidation(self, client):
+        resp = client.get("/")
+        assert resp.headers["etag"].startswith('"')
+        assert resp.headers["cache-control"] == "no-cache"
+
+    def test_index_not_modified_on_matching_etag(self, client):
+        etag = client.get("/").headers["etag"]
+        resp = client.get("/", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+    def test_index_full_body_on_stale_etag(self, client):
+        resp = client.get("/", headers={"If-None-Match": '"outdated"'})
+        assert resp.status_code == 200
+        assert resp.content == (Path(web_app.__file__).parent / "index.html").read_bytes()
+
 
 # ---------------------------------------------------------------------------
 # GET /api/overview
@@ -62,6 +105,189 @@ class TestApiOverview:
         assert "projects" in data
         assert "timestamp" in data
 
+    def test_overview_encoded_with_orjson_when_installed(self, client, monkeypatch):
+        encoded = []
+
+        def dumps(content):
+            encoded.append(content)
+            return json.dumps(content).encode()
+
+        monkeypatch.setattr(web_app, "orjson", SimpleNamespace(dumps=dumps))
+        resp = client.get("/api/overview")
+        assert resp.json() == encoded[0]
+        assert "projects" in encoded[0]
+
+    def test_stdlib_encoding_matches_json_response(self, monkeypatch):
+        from fastapi.responses import JSONResponse
+
+        monkeypatch.setattr(web_app, "orjson", None)
+        content = {"intent": "Café ☕", "tasks": [{"id": 1}], "ended_at": None}
+        assert web_app._encode_json(content) == JSONResponse(content).body
+
+    def test_fast_json_is_default_response_class(self):
+        assert app.router.default_response_class is web_app._FastJSONResponse
+
+    def test_overview_shared_within_ttl(self, client, monkeypatch):
+        store.register_project("Test", "/tmp/test")
+        store.create_session(project_slug="test", intent="Work")
+        calls = []
+        original = store.build_overview
+        monkeypatch.setattr(store, "build_overview", lambda: (calls.append(1), original())[1])
+
+        first = client.get("/api/overview")
+        second = client.get("/api/overview")
+        assert len(calls) == 1
+        assert second.content == first.content
+
+    def test_overview_cache_hit_stays_on_event_loop(self, client, monkeypatch):
+        store.register_project("Test", "/tmp/test")
+        store.create_session(project_slug="test", intent="Work")
+        client.get("/api/overview")
+
+        async def no_thread(*args):
+            raise AssertionError("cache hit went to a worker thread")
+
+        monkeypatch.setattr(web_app.anyio.to_thread, "run_sync", no_thread)
+        assert client.get("/api/overview").status_code == 200
+
+    def test_overview_rebuilt_after_store_change(self, client):
+        store.register_project("Test", "/tmp/test")
+        assert client.get("/api/overview").json()["projects"][0]["active_count"] == 0
+
+        store.create_session(project_slug="test", intent="Work")
+        assert client.get("/api/overview").json()["projects"][0]["active_count"] == 1
+
+    def test_overview_rebuilt_after_ttl(self, client, monkeypatch):
+        store.register_project("Test", "/tmp/test")
+        store.create_session(project_slug="test", intent="Work")
+        calls = []
+        original = store.build_overview
+        monkeypatch.setattr(store, "build_overview", lambda: (calls.append(1), original())[1])
+        monkeypatch.setattr(web_app, "_OVERVIEW_TTL", 0)
+
+        client.get("/api/overview")
+        client.get("/api/overview")
+        assert len(calls) == 2
+
+    def test_overview_not_modified_since_last_modified(self, client, store_root):
+        store.register_project("Test", "/tmp/test")
+        store.create_session(project_slug="test", intent="Work")
+        _age_store(store_root)
+
+        first = client.get("/api/overview")
+        last_modified = first.headers["last-modified"]
+        assert first.headers["cache-control"] == "no-cache"
+
+        resp = client.get("/api/overview", headers={"If-Modified-Since": last_modified})
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+    def test_overview_not_modified_skips_build(self, client, store_root, monkeypatch):
+        store.register_project("Test", "/tmp/test")
+        store.create_session(project_slug="test", intent="Work")
+        _age_store(store_root)
+        last_modified = client.get("/api/overview").headers["last-modified"]
+        monkeypatch.setattr(web_app, "_overview_cache", None)
+        monkeypatch.setattr(store, "build_overview", _must_not_run)
+
+        resp = client.get("/api/overview", headers={"If-Modified-Since": last_modified})
+        assert resp.status_code == 304
+
+    def test_overview_modified_after_write(self, client, store_root):
+        store.register_project("Test", "/tmp/test")
+        _age_store(store_root)
+        last_modified = client.get("/api/overview").headers["last-modified"]
+
+        store.create_session(project_slug="test", intent="Work")
+        resp = client.get("/api/overview", headers={"If-Modified-Since": last_modified})
+        assert resp.status_code == 200
+        assert resp.json()["projects"][0]["active_count"] == 1
+        assert "last-modified" not in resp.headers  # written this second: not advertised yet
+
+    def test_overview_etag_not_modified_without_settling(self, client, monkeypatch):
+        store.register_project("Test", "/tmp/test")
+        store.create_session(project_slug="test", intent="Work")
+        etag = client.get("/api/overview").headers["etag"]
+        assert etag.startswith('W/"')
+        monkeypatch.setattr(web_app, "_overview_cache", None)
+        monkeypatch.setattr(store, "build_overview", _must_not_run)
+
+        resp = client.get("/api/overview", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+
+    def test_overview_etag_changes_after_write(self, client):
+        store.register_project("Test", "/tmp/test")
+        etag = client.get("/api/overview").headers["etag"]
+
+        store.create_session(project_slug="test", intent="Work")
+        resp = client.get("/api/overview", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
+    def test_overview_if_none_match_takes_precedence(self, client, store_root):
+        store.register_project("Test", "/tmp/test")
+        _age_store(store_root)
+        last_modified = client.get("/api/overview").headers["last-modified"]
+
+        resp = client.get("/api/overview", headers={
+            "If-None-Match": '"stale"', "If-Modified-Since": last_modified,
+        })
+        assert resp.status_code == 200
+
+    def test_overview_fields_projects_sessions(self, client):
+        store.register_project("Test", "/tmp/test")
+        store.create_session(project_slug="test", intent="Work")
+        full = client.get("/api/overview").json()
+
+        resp = client.get("/api/overview?fields=intent, started_at,nope")
+        project = resp.json()["projects"][0]
+        assert project["active_sessions"] == [
+            {k: full["projects"][0]["active_sessions"][0][k]
+             for k in ("session_id", "intent", "started_at")},
+        ]
+        assert project["active_count"] == full["projects"][0]["active_count"]
+
+    def test_overview_fields_share_one_build(self, client, monkeypatch):
+        store.register_project("Test", "/tmp/test")
+        store.create_session(project_slug="test", intent="Work")
+        calls = []
+        original = store.build_overview
+        monkeypatch.setattr(store, "build_overview", lambda: (calls.append(1), original())[1])
+
+        full = client.get("/api/overview")
+        slim = client.get("/api/overview?fields=intent")
+        assert len(calls) == 1
+        assert slim.headers["etag"] != full.headers["etag"]
+        assert client.get("/api/overview?fields=intent,intent").content == slim.content
+
+    def test_overview_head_returns_validators_without_build(self, client, monkeypatch):
+        store.register_project("Test", "/tmp/test")
+        store.create_session(project_slug="test", intent="Work")
+        etag = client.get("/api/overview").headers["etag"]
+        monkeypatch.setattr(web_app, "_overview_cache", None)
+        monkeypatch.setattr(store, "build_overview", _must_not_run)
+
+        resp = client.head("/api/overview")
+        assert resp.status_code == 200
+        assert resp.headers["etag"] == etag
+        assert resp.content == b""
+        assert client.head("/api/overview", headers={"If-None-Match": etag}).status_code == 304
+
+    def test_overview_session_turning_stale_is_a_modification(self, client, store_root):
+        store.register_project("Test", "/tmp/test")
+        s = store.create_session(project_slug="test", intent="Work")
+        heartbeat = datetime.now(UTC) - timedelta(hours=25)
+        store.update_session(s.session_id, last_heartbeat=heartbeat.isoformat())
+        _age_store(store_root, seconds=2 * 86400)
+
+        resp = client.get("/api/overview")
+        turned_stale = heartbeat + timedelta(hours=24)
+        assert parsedate_to_datetime(resp.headers["last-modified"]) == turned_stale.replace(
+            microsecond=0,
+        )
+        assert resp.json()["projects"][0]["active_sessions"][0]["is_stale"] is True
+
     def test_overview_with_data(self, client):
         store.register_project("Test", "/tmp/test")
         store.create_session(project_slug="test", intent="Work")
@@ -105,6 +331,60 @@ class TestApiSessionDetail:
         assert data["error"] == "Session not found"
         assert data["code"] == "NOT_FOUND"
 
+    def test_session_detail_not_modified(self, client, store_root, monkeypatch):
+        s = store.create_session(project_slug="p", intent="Detail test")
+        _age_store(store_root)
+        last_modified = client.get(f"/api/session/{s.session_id}").headers["last-modified"]
+        monkeypatch.setattr(store, "get_session", _must_not_run)
+
+        resp = client.get(
+            f"/api/session/{s.session_id}", headers={"If-Modified-Since": last_modified},
+        )
+        assert resp.status_code == 304
+
+    def test_session_detail_etag_not_modified(self, client, monkeypatch):
+        s = store.create_session(project_slug="p", intent="Detail test")
+        etag = client.get(f"/api/session/{s.session_id}").headers["etag"]
+        monkeypatch.setattr(store, "get_session", _must_not_run)
+
+        resp = client.get(f"/api/session/{s.session_id}", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+
+        monkeypatch.undo()
+        store.add_event(s.session_id, "Changed")
+        resp = client.get(f"/api/session/{s.session_id}", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
+    def test_session_detail_body_cached(self, client, monkeypatch):
+        s = store.create_session(project_slug="p", intent="Detail test")
+        first = client.get(f"/api/session/{s.session_id}")
+        monkeypatch.setattr(store, "get_session", _must_not_run)
+
+        second = client.get(f"/api/session/{s.session_id}")
+        assert second.status_code == 200
+        assert second.content == first.content
+
+    def test_session_detail_reread_after_write(self, client):
+        s = store.create_session(project_slug="p", intent="Detail test")
+        client.get(f"/api/session/{s.session_id}")
+        store.add_event(s.session_id, "Changed")
+        resp = client.get(f"/api/session/{s.session_id}")
+        assert resp.json()["events"][-1]["message"] == "Changed"
+
+    def test_session_detail_modified_after_write(self, client, store_root):
+        s = store.create_session(project_slug="p", intent="Detail test")
+        _age_store(store_root)
+        last_modified = client.get(f"/api/session/{s.session_id}").headers["last-modified"]
+
+        store.add_event(s.session_id, "Changed")
+        resp = client.get(
+            f"/api/session/{s.session_id}", headers={"If-Modified-Since": last_modified},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["events"][-1]["message"] == "Changed"
+
     def test_session_detail_includes_tasks(self, client):
         s = store.create_session(project_slug="p", intent="With tasks")
         store.add_task(s.session_id, "Task 1")
@@ -115,6 +395,37 @@ class TestApiSessionDetail:
         assert data["tasks"][0]["subject"] == "Task 1"
 
 
+
+class TestApiSessionsBatch:
+    def test_batch_in_request_order_with_null_for_missing(self, client):
+        a = store.create_session(project_slug="p", intent="A")
+        b = store.create_session(project_slug="p", intent="B")
+        missing = "sess_20000101T0000_0000"
+        ids = ",".join([b.session_id, missing, a.session_id, b.session_id])
+        resp = client.get(f"/api/sessions?ids={ids}")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert list(data) == [b.session_id, missing, a.session_id]
+        assert data[missing] is None
+        assert data[a.session_id] == client.get(f"/api/session/{a.session_id}").json()
+
+    def test_batch_served_from_detail_cache(self, client, monkeypatch):
+        s = store.create_session(project_slug="p", intent="A")
+        client.get(f"/api/session/{s.session_id}")
+        monkeypatch.setattr(store, "get_session", _must_not_run)
+        assert client.get(f"/api/sessions?ids={s.session_id}").json()[s.session_id]["intent"] == "A"
+
+    @pytest.mark.parametrize("ids", [
+        "bad-id",
+        ",",
+        ",".join(f"sess_20000101T0000_{i:04x}" for i in range(101)),
+    ])
+    def test_batch_rejects_invalid_ids(self, client, monkeypatch, ids):
+        monkeypatch.setattr(store, "get_session", _must_not_run)
+        resp = client.get(f"/api/sessions?ids={ids}")
+        assert resp.status_code == 400
+        assert resp.json()["code"] == "VALIDATION_ERROR"
+
 # ---------------------------------------------------------------------------
 # Structured error responses (C4)
 # ---------------------------------------------------------------------------
@@ -128,6 +439,17 @@ class TestStructuredErrors:
         assert data["code"] == "VALIDATION_ERROR"
         assert "error" in data
 
+    @pytest.mark.parametrize("path", [
+        "/api/session/sess_2026..T0000_abcd",
+        "/api/export/session/bad-id",
+    ])
+    def test_malformed_session_id_rejected_before_store(self, client, monkeypatch, path):
+        monkeypatch.setattr(store, "get_session", _must_not_run)
+        monkeypatch.setattr(web_app, "_session_stat", _must_not_run)
+        resp = client.get(path)
+        assert resp.status_code == 400
+        assert resp.json()["code"] == "VALIDATION_ERROR"
+
     def test_not_found_has_code_field(self, client):
         resp = client.get("/api/session/sess_20000101T0000_0000")
         data = resp.json()
@@ -142,6 +464,28 @@ class TestStructuredErrors:
         data = resp.json()
         assert set(data.keys()) == {"error", "code"}
 
+    @pytest.mark.parametrize("level", ["INFO", "DEBUG"])
+    def test_unhandled_error_traceback_only_at_debug(self, monkeypatch, caplog, level):
+        def fail():
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(store, "build_overview", fail)
+        caplog.set_level(level, logger="web.app")
+        with TestClient(app, raise_server_exceptions=False) as c:
+            resp = c.get("/api/overview")
+        assert resp.status_code == 500
+        assert resp.json()["code"] == "INTERNAL_ERROR"
+        (error,) = [r for r in caplog.records if r.levelname == "ERROR"]
+        assert error.getMessage() == "Unhandled RuntimeError on /api/overview: boom"
+        assert error.exc_info is None
+        tracebacks = [r for r in caplog.records if r.exc_info]
+        assert len(tracebacks) == (level == "DEBUG")
+
+    def test_error_body_encoded_once(self):
+        body = web_app._error_body("Session not found", "NOT_FOUND")
+        assert body is web_app._error_body("Session not found", "NOT_FOUND")
+        assert json.loads(body) == {"error": "Session not found", "code": "NOT_FOUND"}
+
 
 # ---------------------------------------------------------------------------
 # 404 for unknown routes
@@ -182,6 +526,50 @@ class TestApiExportSession:
         assert resp.status_code == 200
         assert "application/json" in resp.headers["content-type"]
 
+    def test_completed_export_rendered_once(self, client, monkeypatch):
+        s = store.create_session(project_slug="p", intent="Done")
+        store.complete_session(s.session_id, outcome="Shipped")
+        first = client.get(f"/api/export/session/{s.session_id}?format=markdown")
+
+        monkeypatch.setattr(export, "export_session_markdown", _must_not_run)
+        monkeypatch.setattr(store, "get_session", _must_not_run)
+        second = client.get(f"/api/export/session/{s.session_id}?format=markdown")
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second.headers["content-disposition"] == first.headers["content-disposition"]
+
+    def test_completed_export_rerendered_after_write(self, client):
+        s = store.create_session(project_slug="p", intent="Done")
+        store.complete_session(s.session_id, outcome="Shipped")
+        client.get(f"/api/export/session/{s.session_id}?format=json")
+        store.update_session(s.session_id, outcome="Shipped v2")
+        resp = client.get(f"/api/export/session/{s.session_id}?format=json")
+        assert resp.json()["outcome"] == "Shipped v2"
+
+    def test_active_export_not_cached(self, client):
+        s = store.create_session(project_slug="p", intent="Running")
+        client.get(f"/api/export/session/{s.session_id}?format=json")
+        assert web_app._EXPORT_CACHE == {}
+
+    def test_concurrent_exports_past_cache_max(self, monkeypatch):
+        monkeypatch.setattr(web_app, "_EXPORT_CACHE_MAX", 4)
+        ids = []
+        for i in range(16):
+            s = store.create_session(project_slug="p", intent=f"Done {i}")
+            store.complete_session(s.session_id, outcome="Shipped")
+            ids.append(s.session_id)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            bodies = list(pool.map(lambda sid: web_app._session_export_body(sid, "json"), ids * 10))
+
+        assert [json.loads(b)["session_id"] for b in bodies] == ids * 10
+        assert len(web_app._EXPORT_CACHE) <= 4
+
+    @pytest.mark.parametrize("path", ["/api/export/session/x", "/api/export/project/proj"])
+    def test_export_rejects_unknown_format(self, client, path):
+        resp = client.get(f"{path}?format=xml")
+        assert resp.status_code == 422
+
 
 class TestApiExportProject:
     def test_export_project_json(self, client):
@@ -200,11 +588,43 @@ class TestApiExportProject:
         assert "Content-Disposition" in resp.headers
         assert "# Project: proj" in resp.text
 
+    def test_export_project_markdown_streams_full_document(self, client):
+        for i in range(3):
+            store.create_session(project_slug="proj", intent=f"Session {i}")
+        resp = client.get("/api/export/project/proj?format=markdown")
+        sessions = store.list_sessions(project_slug="proj")
+        assert resp.text == export.export_project_markdown("proj", sessions)
+
     def test_export_project_not_found(self, client):
         resp = client.get("/api/export/project/nonexistent?format=json")
         assert resp.status_code == 404
 
 
+# ---------------------------------------------------------------------------
+# Compression
+# ---------------------------------------------------------------------------
+
+
+class TestCompression:
+    def test_large_json_gzipped_when_accepted(self, client):
+        store.register_project("Test", "/tmp/test")
+        for i in range(5):
+            store.create_session(project_slug="test", intent=f"Session {i}")
+        resp = client.get("/api/overview", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert len(resp.json()["projects"][0]["active_sessions"]) == 5
+
+    def test_not_compressed_without_accept_encoding(self, client):
+        resp = client.get("/", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+
+    def test_small_error_body_not_compressed(self, client):
+        resp = client.get("/api/session/sess_20000101T0000_0000",
+                          headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 404
+        assert "content-encoding" not in resp.headers
+
+
 # ---------------------------------------------------------------------------
 # 404 for unknown routes
 # ---------------------------------------------------------------------------
@@ -214,3 +634,17 @@ class TestUnknownRoutes:
     def test_unknown_route(self, client):
         resp = client.get("/nonexistent")
         assert resp.status_code == 404
+
+
+class TestAppRoutes:
+    def test_each_route_registered_once(self):
+        routes = [(route.path, frozenset(route.methods)) for route in app.routes]
+        assert len(routes) == len(set(routes))
+        assert {path for path, _ in routes} == {
+            "/",
+            "/api/overview",
+            "/api/session/{session_id}",
+            "/api/sessions",
+            "/api/export/session/{session_id}",
+            "/api/export/project/{slug}",
+        }
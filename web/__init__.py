@@ -0,0 +1 @@
+"""Read-only web dashboard (FastAPI app in web.app)."""
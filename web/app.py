@@ -2,8 +2,10 @@
 
 Routes:
   GET /                                      -> serves the HTML dashboard page
-  GET /api/overview                          -> JSON data for polling (every 30s)
+  GET /api/overview?fields=                  -> JSON data for polling (every 30s)
+  HEAD /api/overview?fields=                 -> the overview's ETag/Last-Modified, no build
   GET /api/session/{session_id}              -> single session detail
+  GET /api/sessions?ids=a,b                  -> several session details in one response
   GET /api/export/session/{id}?format=       -> export session as JSON or Markdown
   GET /api/export/project/{slug}?format=     -> export project sessions as JSON or Markdown
 
@@ -12,35 +14,328 @@ All API errors return consistent JSON: {"error": "message", "code": "ERROR_CODE"
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import logging
-import sys
-from dataclasses import asdict
+import os
+import threading
+import time
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
+from typing import Any, Literal
 
+import anyio.to_thread
 from fastapi import FastAPI, Query, Request
-from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
-
-# Ensure lib is importable
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from lib import export, store
+from lib.models import Session, SessionStatus, is_valid_session_id
 from lib.validation import validate_project_slug
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json produces the same payloads
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+
+def _encode_json(content: Any) -> bytes:
+    """Compact UTF-8 JSON, with orjson when it is installed.
+
+    The stdlib branch uses JSONResponse's settings, so clients see the same JSON
+    either way. Routes that cache or splice bodies call this directly instead of
+    building a response object just to take its .body.
+    """
+    if orjson is None:
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"),
+        ).encode("utf-8")
+    return orjson.dumps(content)
+
+
+class _FastJSONResponse(JSONResponse):
+    """JSONResponse that encodes via _encode_json; the app's default response class."""
+
+    def render(self, content: Any) -> bytes:
+        return _encode_json(content)
+
+
+app = FastAPI(
+    docs_url=None, redoc_url=None, openapi_url=None, default_response_class=_FastJSONResponse,
+)
+# Overview JSON and Markdown exports repeat keys and timestamps and compress well;
+# level 5 keeps the CPU cost low for the 30s poll. Small bodies (errors, 304s) are skipped.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+# Literal instead of a regex pattern: validated by set membership, no re.match per request
+ExportFormat = Literal["json", "markdown"]
 
 _HTML_PATH = Path(__file__).parent / "index.html"
+# Read once at import: the page is static, so a restart picks up edits to index.html.
+_HTML_BYTES = _HTML_PATH.read_bytes()
+_HTML_ETAG = f'"{hashlib.sha256(_HTML_BYTES).hexdigest()[:32]}"'
+_HTML_HEADERS = {"ETag": _HTML_ETAG, "Cache-Control": "no-cache"}
+
+# Overview responses are shared for up to _OVERVIEW_TTL seconds while the store is unchanged,
+# so several tabs polling at once (or a reconnect burst) cost one build_overview().
+_OVERVIEW_TTL = 1.0
+_overview_lock = threading.Lock()
+# (store stamp, built at, overview data, {field set: (body, etag)}, last modified);
+# the empty field set is the full overview.
+_OverviewVariants = dict[tuple[str, ...], tuple[bytes, str]]
+_overview_cache: tuple[tuple, float, dict, _OverviewVariants, float] | None = None
+_OVERVIEW_SESSION_LISTS = ("active_sessions", "parked_sessions", "completed_sessions")
+
+# Rendered exports of completed sessions, keyed on (session_id, format) and validated
+# against the session file's stat signature, so a rewrite or archive move re-renders.
+_EXPORT_CACHE: dict[tuple[str, str], tuple[tuple[int, int, int, int], bytes]] = {}
+_EXPORT_CACHE_MAX = 256
+# The export route is a sync def, so it fills _EXPORT_CACHE from threadpool workers.
+_export_cache_lock = threading.Lock()
+
+# Encoded session-detail bodies, validated the same way; every status is cached here,
+# since an active session polled in the detail view mostly reads back unchanged.
+_DETAIL_CACHE: dict[str, tuple[tuple[int, int, int, int], bytes]] = {}
+_DETAIL_CACHE_MAX = 256
+_BATCH_MAX_IDS = 100
+
+
+# ---------------------------------------------------------------------------
+# Response helpers
+# ---------------------------------------------------------------------------
+
+
+def _store_stamp() -> tuple:
+    """Cheap change signature of the files build_overview() depends on.
+
+    Every session save rewrites _index.json atomically (new inode), config and
+    project-state writes land in config.json / PROJECTS_DIR; four stats in total.
+    """
+    stamp = []
+    for path in (store._index_path(), store.CONFIG_PATH, store.PROJECTS_DIR, store.SESSIONS_DIR):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            stamp.append(None)
+            continue
+        stamp.append((st.st_ino, st.st_size, st.st_mtime_ns))
+    return tuple(stamp)
+
+
+def _cached_overview(
+    stamp: tuple, now: float, fields: tuple[str, ...],
+) -> tuple[bytes, float, str] | None:
+    """(body, last_modified, etag) of the cached overview if still valid for stamp at time now."""
+    cached = _overview_cache
+    if cached is not None and cached[0] == stamp and now - cached[1] < _OVERVIEW_TTL:
+        variant = cached[3].get(fields)
+        if variant is not None:
+            return variant[0], cached[4], variant[1]
+    return None
+
+
+def _overview_last_modified(stamp: tuple) -> float:
+    """When the overview content last changed, as a Unix timestamp.
+
+    That is the newest store write in stamp, or later, the moment an active
+    session crossed the stale threshold: is_stale flips without any file changing.
+    """
+    newest = max((entry[2] / 1e9 for entry in stamp if entry), default=0.0)
+    threshold = store.load_config().settings.stale_threshold_hours * 3600
+    now = time.time()
+    for session in store.list_sessions(status=SessionStatus.ACTIVE, full_load=False):
+        if not session.last_heartbeat:
+            continue
+        try:
+            turned_stale = datetime.fromisoformat(session.last_heartbeat).timestamp() + threshold
+        except ValueError:
+            continue
+        if newest < turned_stale <= now:
+            newest = turned_stale
+    return newest
+
+
+def _overview_fields(fields: str | None) -> tuple[str, ...]:
+    """Normalized ?fields= value: sorted, deduplicated, always with session_id; () for all."""
+    if not fields:
+        return ()
+    names = {name.strip() for name in fields.split(",")} - {""}
+    return tuple(sorted(names | {"session_id"})) if names else ()
+
+
+def _encode_overview(data: dict, fields: tuple[str, ...]) -> bytes:
+    """The overview as JSON, with session dicts reduced to fields (if any)."""
+    if fields:
+        keep = frozenset(fields)
+        data = {**data, "projects": [
+            {**project, **{
+                key: [{k: v for k, v in s.items() if k in keep} for s in project[key]]
+                for key in _OVERVIEW_SESSION_LISTS
+            }}
+            for project in data["projects"]
+        ]}
+    return _encode_json(data)
+
+
+def _overview_etag(stamp: tuple, last_modified: float, fields: tuple[str, ...]) -> str:
+    """Validator for the overview content: changes with the store stamp or a stale transition.
+
+    Derived from the inputs, not the body, because every build carries a fresh
+    "timestamp"; it is known without building and needs no settled second.
+    """
+    key = repr((stamp, last_modified, fields)).encode()
+    return f'"{hashlib.sha256(key).hexdigest()[:32]}"'
+
+
+def _overview_validators(stamp: tuple, fields: tuple[str, ...]) -> tuple[float, str]:
+    """(last_modified, etag) of the overview for stamp, without building it. Reads the index."""
+    last_modified = _overview_last_modified(stamp)
+    return last_modified, _overview_etag(stamp, last_modified, fields)
+
+
+def _overview_headers(last_modified: float, etag: str) -> dict[str, str]:
+    # Weak: the tag names the content, not these exact (possibly gzipped) bytes
+    return {
+        **_validation_headers(last_modified), "ETag": f"W/{etag}", "Cache-Control": "no-cache",
+    }
+
+
+def _overview(
+    if_modified_since: float | None, if_none_match: str | None, fields: tuple[str, ...],
+) -> tuple[bytes | None, float, str]:
+    """(body, last_modified, etag); body is None if the client's copy is current (nothing built)."""
+    global _overview_cache
+    with _overview_lock:  # concurrent requests wait for one build instead of each doing it
+        stamp = _store_stamp()
+        now = time.monotonic()
+        cached = _overview_cache
+        if cached is not None and cached[0] == stamp and now - cached[1] < _OVERVIEW_TTL:
+            # Built within the TTL; only this field set still needs encoding
+            data, variants, last_modified = cached[2], cached[3], cached[4]
+            if fields not in variants:
+                etag = _overview_etag(stamp, last_modified, fields)
+                variants[fields] = (_encode_overview(data, fields), etag)
+            body, etag = variants[fields]
+            return body, last_modified, etag
+        last_modified, etag = _overview_validators(stamp, fields)
+        if _validators_match(if_modified_since, if_none_match, last_modified, etag):
+            return None, last_modified, etag
+        data = store.build_overview()
+        body = _encode_overview(data, fields)
+        _overview_cache = (stamp, now, data, {fields: (body, etag)}, last_modified)
+        return body, last_modified, etag
 
 
 # ---------------------------------------------------------------------------
-# Error response helper
+# Conditional GET (If-Modified-Since)
 # ---------------------------------------------------------------------------
 
 
-def _error_response(message: str, code: str, status_code: int) -> JSONResponse:
-    return JSONResponse({"error": message, "code": code}, status_code=status_code)
+def _if_modified_since(request: Request) -> float | None:
+    """The If-Modified-Since header as a Unix timestamp, or None if absent/unparseable."""
+    header = request.headers.get("if-modified-since")
+    if not header:
+        return None
+    try:
+        return parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _settled(last_modified: float) -> bool:
+    """True once last_modified is a full second old.
+
+    HTTP dates have 1 s resolution: a change in the current second may be followed
+    by another with the same date, so such a date is not advertised or honoured yet.
+    """
+    return time.time() - last_modified >= 1
+
+
+def _not_modified(if_modified_since: float | None, last_modified: float) -> bool:
+    return (
+        if_modified_since is not None
+        and _settled(last_modified)
+        and if_modified_since >= int(last_modified)
+    )
+
+
+def _validators_match(
+    if_modified_since: float | None, if_none_match: str | None, last_modified: float, etag: str,
+) -> bool:
+    """True if the client's copy is current according to its conditional headers."""
+    # If-None-Match takes precedence: If-Modified-Since is ignored when both are sent (RFC 9110)
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    return _not_modified(if_modified_since, last_modified)
+
+
+def _validation_headers(last_modified: float | None) -> dict[str, str]:
+    """Last-Modified (once settled) plus no-cache, so browsers revalidate every poll."""
+    if last_modified is None or not _settled(last_modified):
+        return {}
+    return {"Last-Modified": formatdate(last_modified, usegmt=True), "Cache-Control": "no-cache"}
+
+
+def _session_stat(session_id: str) -> os.stat_result | None:
+    """stat of the session file (live or archived), None if absent. session_id must be valid."""
+    for directory in (store.SESSIONS_DIR, store.ARCHIVE_DIR):
+        try:
+            return os.stat(directory / f"{session_id}.json", follow_symlinks=False)
+        except FileNotFoundError:
+            continue
+    return None
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int, int, int]:
+    """Signature that changes on every rewrite of a session file (new inode, ctime)."""
+    return st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns
+
+
+def _session_etag(st: os.stat_result) -> str:
+    """Validator for a session file; no hashing needed, the stat fields change on every write."""
+    return f'"{st.st_ino:x}-{st.st_size:x}-{st.st_mtime_ns:x}"'
+
+
+def _cached_detail(session_id: str, st: os.stat_result) -> bytes | None:
+    """Encoded detail of session_id from _DETAIL_CACHE, None unless cached for this stat."""
+    cached = _DETAIL_CACHE.get(session_id)
+    if cached is not None and cached[0] == _stat_key(st):
+        return cached[1]
+    return None
+
+
+def _store_detail(session: Session, st: os.stat_result) -> bytes:
+    """Encode a session detail and cache it under st. Called on the event loop only."""
+    body = _encode_json(session.to_dict())
+    _bounded_put(_DETAIL_CACHE, session.session_id, (_stat_key(st), body), _DETAIL_CACHE_MAX)
+    return body
+
+
+def _bounded_put(cache: dict, key: Any, value: Any, maximum: int) -> None:
+    """Insert into a size-capped dict, evicting the oldest entry when full."""
+    if len(cache) >= maximum and key not in cache:
+        cache.pop(next(iter(cache), None), None)
+    cache[key] = value
+
+
+@functools.cache
+def _error_body(message: str, code: str) -> bytes:
+    """Encoded error body; there are only a handful of (message, code) pairs, each encoded once."""
+    return _encode_json({"error": message, "code": code})
+
+
+def _error_response(message: str, code: str, status_code: int) -> Response:
+    return Response(_error_body(message, code), status_code=status_code,
+                    media_type="application/json")
+
+
+def _invalid_session_id_response() -> Response:
+    """The 400 the ValueError handler would give, without touching the store or raising."""
+    return _error_response("Invalid request", "VALIDATION_ERROR", 400)
 
 
 # ---------------------------------------------------------------------------
@@ -62,7 +357,11 @@ async def json_decode_error_handler(request: Request, exc: json.JSONDecodeError)
 
 @app.exception_handler(Exception)
 async def generic_error_handler(request: Request, exc: Exception):
-    logger.error("Unhandled error on %s: %s", request.url.path, exc, exc_info=True)
+    # Class and message only: formatting a traceback per 500 is costly and floods the log
+    # when something hammers a failing route. Run with DEBUG logging to get the traceback.
+    logger.error("Unhandled %s on %s: %s", type(exc).__name__, request.url.path, exc)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Traceback for unhandled error on %s", request.url.path, exc_info=exc)
     return _error_response("Internal server error", "INTERNAL_ERROR", 500)
 
 
@@ -71,22 +370,116 @@ async def generic_error_handler(request: Request, exc: Exception):
 # ---------------------------------------------------------------------------
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an If-None-Match header lists etag (or is "*")."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
+
+# Routes that only touch memory are async (no threadpool hop); store I/O is
+# pushed to a worker thread explicitly. The export routes stay sync: FastAPI
+# already runs those in the threadpool and they are not on the polling path.
+
+
 @app.get("/")
-def index():
-    return FileResponse(_HTML_PATH, media_type="text/html")
+async def index(request: Request):
+    if _etag_matches(request.headers.get("if-none-match"), _HTML_ETAG):
+        return Response(status_code=304, headers=_HTML_HEADERS)
+    return Response(_HTML_BYTES, media_type="text/html", headers=_HTML_HEADERS)
 
 
 @app.get("/api/overview")
-def api_overview():
-    return JSONResponse(store.build_overview())
+async def api_overview(request: Request, fields: str | None = Query(None, max_length=500)):
+    """Dashboard overview.
+
+    ?fields=a,b limits every session dict (active, parked, completed) to those keys
+    plus session_id; project-level keys are always included. Unknown names are ignored.
+    """
+    field_set = _overview_fields(fields)
+    since = _if_modified_since(request)
+    if_none_match = request.headers.get("if-none-match")
+    # Lock-free peek on the event loop (four stats); build in a thread on a miss
+    entry = _cached_overview(_store_stamp(), time.monotonic(), field_set)
+    if entry is None:
+        entry = await anyio.to_thread.run_sync(_overview, since, if_none_match, field_set)
+    body, last_modified, etag = entry
+    headers = _overview_headers(last_modified, etag)
+    if body is None or _validators_match(since, if_none_match, last_modified, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+@app.head("/api/overview")
+async def api_overview_head(request: Request, fields: str | None = Query(None, max_length=500)):
+    """Validators only, for monitors checking whether the overview changed; never builds it."""
+    field_set = _overview_fields(fields)
+    stamp = _store_stamp()
+    entry = _cached_overview(stamp, time.monotonic(), field_set)
+    if entry is not None:
+        _, last_modified, etag = entry
+    else:
+        last_modified, etag = await anyio.to_thread.run_sync(
+            _overview_validators, stamp, field_set,
+        )
+    headers = _overview_headers(last_modified, etag)
+    not_modified = _validators_match(
+        _if_modified_since(request), request.headers.get("if-none-match"), last_modified, etag,
+    )
+    return Response(status_code=304 if not_modified else 200, headers=headers)
 
 
 @app.get("/api/session/{session_id}")
-def api_session_detail(session_id: str):
-    session = store.get_session(session_id)
-    if not session:
+async def api_session_detail(session_id: str, request: Request):
+    if not is_valid_session_id(session_id):
+        return _invalid_session_id_response()
+    # One stat on the event loop; the file is only read (in a thread) if it changed.
+    # Stat before read: a concurrent write can only make the date older than the body.
+    st = _session_stat(session_id)
+    if st is None:
         return _error_response("Session not found", "NOT_FOUND", 404)
-    return JSONResponse(asdict(session))
+    etag = _session_etag(st)
+    headers = {**_validation_headers(st.st_mtime), "ETag": f"W/{etag}", "Cache-Control": "no-cache"}
+    if _validators_match(
+        _if_modified_since(request), request.headers.get("if-none-match"), st.st_mtime, etag,
+    ):
+        return Response(status_code=304, headers=headers)
+
+    body = _cached_detail(session_id, st)
+    if body is None:
+        session = await anyio.to_thread.run_sync(store.get_session, session_id)
+        if not session:
+            return _error_response("Session not found", "NOT_FOUND", 404)
+        body = _store_detail(session, st)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+@app.get("/api/sessions")
+async def api_sessions(ids: str = Query(..., max_length=_BATCH_MAX_IDS * 32)):
+    """Details of up to _BATCH_MAX_IDS sessions as {session_id: detail or null}.
+
+    ids is comma-separated; duplicates are dropped, request order is kept.
+    Shares _DETAIL_CACHE with the single-session route; misses are read in one thread hop.
+    """
+    session_ids = list(dict.fromkeys(sid.strip() for sid in ids.split(",") if sid.strip()))
+    if not 0 < len(session_ids) <= _BATCH_MAX_IDS or not all(
+        map(is_valid_session_id, session_ids)
+    ):
+        return _invalid_session_id_response()
+
+    stats = {sid: _session_stat(sid) for sid in session_ids}
+    bodies = {sid: st and _cached_detail(sid, st) for sid, st in stats.items()}
+    misses = [sid for sid, body in bodies.items() if body is None and stats[sid] is not None]
+    if misses:
+        sessions = await anyio.to_thread.run_sync(lambda: [store.get_session(s) for s in misses])
+        for sid, session in zip(misses, sessions, strict=True):
+            if session:
+                bodies[sid] = _store_detail(session, stats[sid])
+
+    # The cached bodies are spliced in as-is; validated IDs need no JSON escaping.
+    parts = [f'"{sid}":'.encode() + (bodies[sid] or b"null") for sid in session_ids]
+    return Response(b"{" + b",".join(parts) + b"}", media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -97,47 +490,74 @@ def api_session_detail(session_id: str):
 @app.get("/api/export/session/{session_id}")
 def api_export_session(
     session_id: str,
-    format: str = Query("json", pattern="^(json|markdown)$"),
+    format: ExportFormat = "json",
 ):
-    session = store.get_session(session_id)
-    if not session:
+    if not is_valid_session_id(session_id):
+        return _invalid_session_id_response()
+    if format == "markdown":
+        headers = {"Content-Disposition": f'attachment; filename="{session_id}.md"'}
+        media_type = "text/markdown; charset=utf-8"
+    else:
+        headers, media_type = None, "application/json"
+
+    body = _session_export_body(session_id, format)
+    if body is None:
         return _error_response("Session not found", "NOT_FOUND", 404)
+    return Response(body, media_type=media_type, headers=headers)
+
 
+def _session_export_body(session_id: str, format: ExportFormat) -> bytes | None:
+    """Rendered export of a session, None if it does not exist.
+
+    Completed sessions no longer change, so their exports are rendered once and reused
+    until the session file's stat signature changes. Other sessions render every time.
+    """
+    st = _session_stat(session_id)
+    if st is None:
+        return None
+    # Signature taken before the read: if the file is replaced in between,
+    # the next request sees a new signature and renders again.
+    key = _stat_key(st)
+    cached = _EXPORT_CACHE.get((session_id, format))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    session = store.get_session(session_id)
+    if not session:
+        return None
     if format == "markdown":
-        content = export.export_session_markdown(session)
-        filename = f"{session_id}.md"
-        return PlainTextResponse(
-            content,
-            media_type="text/markdown; charset=utf-8",
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-        )
+        body = export.export_session_markdown(session).encode()
+    else:
+        body = _encode_json(export.export_session_json(session))
 
-    return JSONResponse(export.export_session_json(session))
+    if session.status == SessionStatus.COMPLETED:
+        with _export_cache_lock:
+            _bounded_put(_EXPORT_CACHE, (session_id, format), (key, body), _EXPORT_CACHE_MAX)
+    return body
 
 
 @app.get("/api/export/project/{slug}")
 def api_export_project(
     slug: str,
-    format: str = Query("json", pattern="^(json|markdown)$"),
+    format: ExportFormat = "json",
     include_archived: bool = Query(False),
     limit: int = Query(100, ge=1, le=500),
 ):
     validate_project_slug(slug)
     sessions = store.list_sessions(
-        project_slug=slug, include_archived=include_archived,
+        project_slug=slug, include_archived=include_archived, limit=limit,
     )
     if not sessions:
         return _error_response("No sessions found for project", "NOT_FOUND", 404)
 
-    sessions = sessions[:limit]
-
     if format == "markdown":
-        content = export.export_project_markdown(slug, sessions)
+        # Streamed per session: up to `limit` sessions are never held as one string
         filename = f"{slug}-sessions.md"
-        return PlainTextResponse(
-            content,
+        return StreamingResponse(
+            export.iter_project_markdown(slug, sessions),
             media_type="text/markdown; charset=utf-8",
             headers={"Content-Disposition": f'attachment; filename="{filename}"'},
         )
 
-    return JSONResponse(export.export_project_json(slug, sessions))
+    return Response(_encode_json(export.export_project_json(slug, sessions)),
+                    media_type="application/json")